@@ -7,7 +7,9 @@ Extracts requirements, keywords, and calculates match scores
 from __future__ import annotations
 
 import json
+import os
 import re
+import threading
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,11 @@ from typing import Any
 
 import yaml
 
+# job_id -> filename index kept next to the analyses by save_analysis()
+ANALYZED_INDEX_NAME = "_index.json"
+# Serializes index updates between threads of one process
+_INDEX_LOCK = threading.Lock()
+
 
 @dataclass
 class JobRequirement:
@@ -388,6 +395,24 @@ class JobAnalyzer:
         with open(filepath, "w") as f:
             json.dump(asdict(analysis), f, indent=2)
 
+        # Record the file in the index so lookups by job_id skip the directory scan.
+        # The index is only a shortcut (readers fall back to scanning), so a
+        # missing or corrupt one is rebuilt from here rather than failing the save
+        index_path = output_path / ANALYZED_INDEX_NAME
+        with _INDEX_LOCK:
+            try:
+                index = json.loads(index_path.read_text())
+            except (OSError, ValueError):
+                index = {}
+            if not isinstance(index, dict):
+                index = {}
+            index[analysis.job_id] = filename
+            tmp_path = index_path.with_name(
+                f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_text(json.dumps(index, indent=2))
+            os.replace(tmp_path, index_path)
+
         return filepath
 
 
@@ -88,6 +88,9 @@ def discover(
     locale: str | None = typer.Option(
         None, help="Locale for region-specific config (e.g., 'israel')"
     ),
+    new_only: bool = typer.Option(
+        False, "--new-only", help="Skip jobs already discovered in previous runs"
+    ),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Minimal output"),
 ) -> None:
     """Search for jobs across platforms."""
@@ -106,6 +109,7 @@ def discover(
             hours_old=hours,
             output_format="both",
             locale=locale,
+            new_only=new_only,
         )
 
         if not quiet:
@@ -4,15 +4,22 @@ Job discovery module for multi-platform job search.
 Exports:
     search_jobs: Main function to search for jobs across platforms
     load_targets: Load target companies and search parameters from config
+    load_compiled_targets: Cached targets config plus its precomputed TargetsLookup
+    build_targets_lookup: Precompute TargetsLookup matchers from a targets dict
     apply_targets_filter: Filter and enrich jobs based on targets.yaml
     deduplicate_jobs: Remove duplicate job postings
+    SeenJobsFilter: Persistent Bloom filter of previously discovered job URLs
     print_summary: Print formatted summary of search results
 """
 
 from .job_searcher import (
+    SeenJobsFilter,
+    TargetsLookup,
     _merge_locale,
     apply_targets_filter,
+    build_targets_lookup,
     deduplicate_jobs,
+    load_compiled_targets,
     load_targets,
     print_summary,
     search_jobs,
@@ -21,8 +28,12 @@ from .job_searcher import (
 __all__ = [
     "search_jobs",
     "load_targets",
+    "load_compiled_targets",
+    "build_targets_lookup",
+    "TargetsLookup",
     "apply_targets_filter",
     "deduplicate_jobs",
+    "SeenJobsFilter",
     "print_summary",
     "_merge_locale",
 ]
@@ -8,16 +8,28 @@ from __future__ import annotations
 
 import argparse
 import copy
+import hashlib
 import json
+import math
+import os
 import re
+import struct
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import yaml
 from jobspy import scrape_jobs
 
 # Configuration paths
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+DISCOVERED_DIR = Path(__file__).parent.parent.parent / "jobs" / "discovered"
+SEEN_JOBS_PATH = DISCOVERED_DIR / ".seen_jobs.bloom"
+
+# Ordinal rank of each tier for sorting (anything else sorts last)
+TIER_ORD = {"tier1": 0, "tier2": 1, "tier3": 2, "unknown": 3}
 
 
 def _merge_locale(base: dict, overrides: dict) -> dict:
@@ -115,6 +127,33 @@ def load_targets(locale: str | None = None) -> dict:
     return _merge_locale(raw, locales[locale])
 
 
+_EXPERIENCE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # Range pattern first: "3-5 years" → captures the lower bound (3)
+        r"(\d+)\s*-\s*\d+\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)",
+        r"(?:minimum|at least|min)\s*(\d+)\s*(?:years?|yrs?)",
+        r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)",
+        r"(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:professional|relevant|hands-on|industry)",
+    )
+]
+
+
+def _compile_substring_matcher(words: list[str]) -> re.Pattern[str] | None:
+    """
+    Compile a list of literal substrings into one alternation regex.
+
+    ``pattern.search(text)`` is equivalent to ``any(w in text for w in words)``
+    but scans *text* once in C instead of once per word in Python.
+
+    Returns None when *words* is empty (nothing can match).
+    """
+    words = [w for w in words if w]
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(w) for w in words))
+
+
 def _extract_experience_years(text: str) -> int | None:
     """
     Extract required years of experience from job text.
@@ -127,16 +166,8 @@ def _extract_experience_years(text: str) -> int | None:
     if not text:
         return None
 
-    patterns = [
-        # Range pattern first: "3-5 years" → captures the lower bound (3)
-        r"(\d+)\s*-\s*\d+\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)",
-        r"(?:minimum|at least|min)\s*(\d+)\s*(?:years?|yrs?)",
-        r"(\d+)\+?\s*(?:years?|yrs?)\s*(?:of\s+)?(?:experience|exp)",
-        r"(\d+)\s*(?:years?|yrs?)\s*(?:of\s+)?(?:professional|relevant|hands-on|industry)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _EXPERIENCE_PATTERNS:
+        match = pattern.search(text)
         if match:
             try:
                 return int(match.group(1))
@@ -146,27 +177,32 @@ def _extract_experience_years(text: str) -> int | None:
     return None
 
 
-def apply_targets_filter(jobs: list[dict], targets: dict) -> list[dict]:
-    """
-    Apply targets configuration to job list.
+@dataclass(frozen=True)
+class TargetsLookup:
+    """Matchers and thresholds precomputed from a targets config."""
+
+    company_tiers: dict[str, dict]
+    excluded_companies: frozenset[str]
+    excluded_keywords: re.Pattern[str] | None
+    primary_roles: re.Pattern[str] | None
+    secondary_roles: re.Pattern[str] | None
+    bad_title_words: tuple[str, ...]
+    bad_desc_words: tuple[str, ...]
+    penalty_per_match: float
+    exp_min: int
+    exp_max: int
 
-    - Adds tier info (tier1/tier2/tier3/unknown)
-    - Adds priority score
-    - Adds auto_apply eligibility
-    - Filters out exclusions
-    - Applies bad word penalties (soft filter)
-    - Checks experience range match
+
+def build_targets_lookup(targets: dict) -> TargetsLookup:
+    """
+    Precompute the company/role/exclusion matchers used by apply_targets_filter.
 
     Args:
-        jobs: List of job dictionaries
         targets: Loaded targets.yaml configuration
 
     Returns:
-        Filtered and enriched job list
+        TargetsLookup ready to be reused across many filter calls
     """
-    if not targets:
-        return jobs
-
     # Build company lookup
     company_tiers = {}
     for tier_name in ["tier1", "tier2", "tier3"]:
@@ -180,26 +216,97 @@ def apply_targets_filter(jobs: list[dict], targets: dict) -> list[dict]:
                 "careers_url": company.get("careers_url"),
             }
 
-    # Get exclusions
     exclusions = targets.get("exclusions", {})
-    excluded_companies = [c.lower() for c in exclusions.get("companies", [])]
-    excluded_keywords = [k.lower() for k in exclusions.get("keywords", [])]
-
-    # Get target roles
     target_roles = targets.get("target_roles", {})
-    primary_roles = [r.lower() for r in target_roles.get("primary", [])]
-    secondary_roles = [r.lower() for r in target_roles.get("secondary", [])]
-
-    # Get bad words config
     bad_words_config = targets.get("bad_words", {})
-    bad_title_words = [w.lower() for w in bad_words_config.get("title_words", [])]
-    bad_desc_words = [w.lower() for w in bad_words_config.get("description_words", [])]
-    penalty_per_match = bad_words_config.get("penalty_per_match", 5.0)
-
-    # Get experience range config
     exp_range = targets.get("experience_range", {})
-    exp_min = exp_range.get("min_years", 0)
-    exp_max = exp_range.get("max_years", 50)
+
+    return TargetsLookup(
+        company_tiers=company_tiers,
+        excluded_companies=frozenset(c.lower() for c in exclusions.get("companies", [])),
+        excluded_keywords=_compile_substring_matcher(
+            [k.lower() for k in exclusions.get("keywords", [])]
+        ),
+        primary_roles=_compile_substring_matcher(
+            [r.lower() for r in target_roles.get("primary", [])]
+        ),
+        secondary_roles=_compile_substring_matcher(
+            [r.lower() for r in target_roles.get("secondary", [])]
+        ),
+        bad_title_words=tuple(w.lower() for w in bad_words_config.get("title_words", [])),
+        bad_desc_words=tuple(w.lower() for w in bad_words_config.get("description_words", [])),
+        penalty_per_match=bad_words_config.get("penalty_per_match", 5.0),
+        exp_min=exp_range.get("min_years", 0),
+        exp_max=exp_range.get("max_years", 50),
+    )
+
+
+@lru_cache(maxsize=8)
+def _compiled_targets(locale: str | None, _mtime_ns: int | None) -> tuple[dict, TargetsLookup]:
+    """Load targets and build their lookup once per (locale, targets.yaml mtime).
+
+    *_mtime_ns* only participates in the cache key so edits to targets.yaml
+    invalidate the entry.
+    """
+    targets = load_targets(locale=locale)
+    return targets, build_targets_lookup(targets)
+
+
+def load_compiled_targets(locale: str | None = None) -> tuple[dict, TargetsLookup]:
+    """
+    Load targets config together with its precomputed lookup.
+
+    Results are cached per process and invalidated when targets.yaml changes.
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        locale: Optional locale name, as for :func:`load_targets`.
+
+    Returns:
+        Tuple of (targets dict, TargetsLookup)
+    """
+    targets_path = CONFIG_DIR / "targets.yaml"
+    mtime_ns = targets_path.stat().st_mtime_ns if targets_path.exists() else None
+    return _compiled_targets(locale, mtime_ns)
+
+
+def apply_targets_filter(
+    jobs: list[dict], targets: dict, lookup: TargetsLookup | None = None
+) -> list[dict]:
+    """
+    Apply targets configuration to job list.
+
+    - Adds tier info (tier1/tier2/tier3/unknown)
+    - Adds priority score
+    - Adds auto_apply eligibility
+    - Filters out exclusions
+    - Applies bad word penalties (soft filter)
+    - Checks experience range match
+
+    Args:
+        jobs: List of job dictionaries
+        targets: Loaded targets.yaml configuration
+        lookup: Precomputed lookup for *targets*; built on the fly if omitted
+
+    Returns:
+        Filtered and enriched job list
+    """
+    if not targets:
+        return jobs
+
+    if lookup is None:
+        lookup = build_targets_lookup(targets)
+
+    company_tiers = lookup.company_tiers
+    excluded_companies = lookup.excluded_companies
+    excluded_keywords = lookup.excluded_keywords
+    primary_roles = lookup.primary_roles
+    secondary_roles = lookup.secondary_roles
+    bad_title_words = lookup.bad_title_words
+    bad_desc_words = lookup.bad_desc_words
+    penalty_per_match = lookup.penalty_per_match
+    exp_min = lookup.exp_min
+    exp_max = lookup.exp_max
 
     enriched_jobs = []
     for job in jobs:
@@ -210,7 +317,9 @@ def apply_targets_filter(jobs: list[dict], targets: dict) -> list[dict]:
         # Check exclusions (hard filter)
         if company in excluded_companies:
             continue
-        if any(kw in title or kw in description for kw in excluded_keywords):
+        if excluded_keywords and (
+            excluded_keywords.search(title) or excluded_keywords.search(description)
+        ):
             continue
 
         # Add tier info
@@ -227,10 +336,10 @@ def apply_targets_filter(jobs: list[dict], targets: dict) -> list[dict]:
         job["auto_apply_eligible"] = tier_info["auto_apply"]
 
         # Check role match
-        if any(role in title for role in primary_roles):
+        if primary_roles and primary_roles.search(title):
             job["role_match"] = "primary"
             job["target_priority"] = min(job["target_priority"], 1)
-        elif any(role in title for role in secondary_roles):
+        elif secondary_roles and secondary_roles.search(title):
             job["role_match"] = "secondary"
             job["target_priority"] = min(job["target_priority"], 2)
         else:
@@ -270,28 +379,211 @@ def apply_targets_filter(jobs: list[dict], targets: dict) -> list[dict]:
 
         enriched_jobs.append(job)
 
-    # Sort by priority (lower is better), then by penalty (lower is better)
-    enriched_jobs.sort(
-        key=lambda j: (
-            j.get("target_priority", 4),
-            j.get("bad_word_penalty", 0),
-            j.get("target_tier", "z"),
-        )
+    # Sort by priority (lower is better), then by penalty (lower is better),
+    # then by tier. np.lexsort is stable and treats the last key as primary.
+    count = len(enriched_jobs)
+    priorities = np.fromiter(
+        (j["target_priority"] for j in enriched_jobs), dtype=np.int64, count=count
+    )
+    penalties = np.fromiter(
+        (j["bad_word_penalty"] for j in enriched_jobs), dtype=np.float64, count=count
     )
+    tiers = np.fromiter(
+        (TIER_ORD.get(j["target_tier"], len(TIER_ORD)) for j in enriched_jobs),
+        dtype=np.int8,
+        count=count,
+    )
+    order = np.lexsort((tiers, penalties, priorities))
+
+    return [enriched_jobs[i] for i in order]
+
+
+class _BloomSlice:
+    """One fixed-size Bloom filter inside a SeenJobsFilter."""
+
+    __slots__ = ("capacity", "count", "num_bits", "num_hashes", "bits")
+
+    def __init__(self, capacity: int, error_rate: float):
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.capacity = capacity
+        self.count = 0
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.bits = bytearray((num_bits + 7) // 8)
+
+    def positions(self, h1: int, h2: int) -> list[int]:
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, hashes: tuple[int, int]) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(*hashes))
+
+    def add(self, hashes: tuple[int, int]) -> None:
+        bits = self.bits
+        for pos in self.positions(*hashes):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+
+class SeenJobsFilter:
+    """
+    Persistent scalable Bloom filter of job URLs seen in previous discovery runs.
+
+    Membership checks may return false positives but never false negatives,
+    so a URL that was added is always reported as seen. The filter starts
+    with one slice sized for *capacity* URLs; when a slice fills up, a new
+    one with twice the capacity and half the error rate is added, so the
+    overall false-positive rate stays around *error_rate* however many
+    postings accumulate. Stored as a small binary file instead of
+    re-reading every past ``jobs/discovered/*.json``.
+    """
 
-    return enriched_jobs
+    _MAGIC = b"SJB2"
+    # magic, error rate, slice count; then per slice a header and its bits
+    _HEADER = struct.Struct("<4sdI")
+    _SLICE_HEADER = struct.Struct("<QQQI")  # capacity, count, num_bits, num_hashes
+    # Files written before slices were introduced: num_bits, num_hashes, bits
+    _LEGACY_HEADER = struct.Struct("<QI")
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-4):
+        self.error_rate = error_rate
+        # Slice i gets error_rate / 2**(i + 1); the series sums to error_rate
+        self.slices = [_BloomSlice(capacity, error_rate / 2)]
+
+    @staticmethod
+    def _hashes(key: str) -> tuple[int, int]:
+        # Kirsch-Mitzenmacher double hashing over one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+    def __contains__(self, key: str) -> bool:
+        hashes = self._hashes(key)
+        return any(hashes in bloom_slice for bloom_slice in self.slices)
+
+    def __len__(self) -> int:
+        """Approximate number of distinct URLs added."""
+        return sum(bloom_slice.count for bloom_slice in self.slices)
+
+    def add(self, key: str) -> None:
+        """Record *key* as seen."""
+        hashes = self._hashes(key)
+        if any(hashes in bloom_slice for bloom_slice in self.slices):
+            return  # Already seen: don't count it against the capacity again
+        current = self.slices[-1]
+        if current.count >= current.capacity:
+            current = _BloomSlice(
+                current.capacity * 2, self.error_rate / 2 ** (len(self.slices) + 1)
+            )
+            self.slices.append(current)
+        current.add(hashes)
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> SeenJobsFilter:
+        """
+        Load a filter from *path* (default ``SEEN_JOBS_PATH``).
+
+        Returns an empty filter if the file does not exist, or if it is
+        truncated or corrupt (e.g. left behind by an interrupted run).
+        """
+        path = path or SEEN_JOBS_PATH
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return cls()
+
+        bloom = cls._parse(data)
+        if bloom is None:
+            print(f"Note: ignoring corrupt seen-jobs file {path}")
+            return cls()
+        return bloom
+
+    @classmethod
+    def _parse(cls, data: bytes) -> SeenJobsFilter | None:
+        """Decode a saved filter, or None if *data* isn't a complete one."""
+        if data[:4] != cls._MAGIC:
+            return cls._parse_legacy(data)
+        if len(data) < cls._HEADER.size:
+            return None
+
+        bloom = cls.__new__(cls)
+        _, bloom.error_rate, num_slices = cls._HEADER.unpack_from(data)
+        bloom.slices = []
+        offset = cls._HEADER.size
+        for _ in range(num_slices):
+            if len(data) < offset + cls._SLICE_HEADER.size:
+                return None
+            bloom_slice = _BloomSlice.__new__(_BloomSlice)
+            (
+                bloom_slice.capacity,
+                bloom_slice.count,
+                bloom_slice.num_bits,
+                bloom_slice.num_hashes,
+            ) = cls._SLICE_HEADER.unpack_from(data, offset)
+            offset += cls._SLICE_HEADER.size
+            size = (bloom_slice.num_bits + 7) // 8
+            if not (bloom_slice.capacity and bloom_slice.num_bits and bloom_slice.num_hashes):
+                return None
+            if len(data) < offset + size:
+                return None
+            bloom_slice.bits = bytearray(data[offset : offset + size])
+            offset += size
+            bloom.slices.append(bloom_slice)
+        if offset != len(data) or not bloom.slices or not 0 < bloom.error_rate < 1:
+            return None
+        return bloom
+
+    @classmethod
+    def _parse_legacy(cls, data: bytes) -> SeenJobsFilter | None:
+        """Decode a single fixed-size filter from before slices were stored."""
+        header_size = cls._LEGACY_HEADER.size
+        if len(data) < header_size:
+            return None
+        num_bits, num_hashes = cls._LEGACY_HEADER.unpack_from(data)
+        if not (num_bits and num_hashes) or len(data) - header_size != (num_bits + 7) // 8:
+            return None
+
+        # Its element count wasn't recorded, so treat it as full: new URLs
+        # go to a fresh slice instead of degrading the old one further
+        bloom = cls()
+        old = _BloomSlice.__new__(_BloomSlice)
+        old.num_bits, old.num_hashes = num_bits, num_hashes
+        old.capacity = old.count = max(1, round(num_bits * math.log(2) / num_hashes))
+        old.bits = bytearray(data[header_size:])
+        bloom.slices.insert(0, old)
+        return bloom
+
+    def save(self, path: Path | None = None) -> None:
+        """Atomically write the filter to *path* (default ``SEEN_JOBS_PATH``)."""
+        path = path or SEEN_JOBS_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        parts = [self._HEADER.pack(self._MAGIC, self.error_rate, len(self.slices))]
+        for bloom_slice in self.slices:
+            parts.append(
+                self._SLICE_HEADER.pack(
+                    bloom_slice.capacity,
+                    bloom_slice.count,
+                    bloom_slice.num_bits,
+                    bloom_slice.num_hashes,
+                )
+            )
+            parts.append(bloom_slice.bits)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(b"".join(parts))
+        os.replace(tmp, path)
 
 
-def deduplicate_jobs(jobs: list[dict]) -> list[dict]:
+def deduplicate_jobs(jobs: list[dict], seen_jobs: SeenJobsFilter | None = None) -> list[dict]:
     """
     Remove duplicate job postings.
 
     Matches by:
     - job_url (exact match)
     - (company + role + location) combination
+    - job_url seen in a previous run (only when *seen_jobs* is given)
 
     Args:
         jobs: List of job dictionaries
+        seen_jobs: Optional filter of URLs from previous runs to skip
 
     Returns:
         List of unique job dictionaries
@@ -308,6 +600,8 @@ def deduplicate_jobs(jobs: list[dict]) -> list[dict]:
             continue
         if combo_key in seen:
             continue
+        if seen_jobs is not None and url_key and url_key in seen_jobs:
+            continue
 
         seen.add(url_key)
         seen.add(combo_key)
@@ -326,6 +620,7 @@ def search_jobs(
     is_remote: bool = True,
     output_format: str = "both",
     locale: str | None = None,
+    new_only: bool = False,
 ) -> dict:
     """
     Search for jobs across multiple platforms.
@@ -340,6 +635,7 @@ def search_jobs(
         is_remote: Filter for remote jobs only
         output_format: "json", "csv", or "both"
         locale: Optional locale name (e.g. "israel") for region-specific config
+        new_only: Skip jobs whose URL was already discovered in a previous run
 
     Returns:
         Dictionary with search results and metadata
@@ -349,7 +645,7 @@ def search_jobs(
 
     # Apply locale overrides for location/country when caller used defaults
     if locale:
-        targets_for_defaults = load_targets(locale=locale)
+        targets_for_defaults, _ = load_compiled_targets(locale=locale)
         sp = targets_for_defaults.get("search_params", {})
         if location == "remote":
             preferred = sp.get("locations", {}).get("preferred", [])
@@ -385,23 +681,21 @@ def search_jobs(
         print("No jobs found matching criteria.")
         return {"jobs": [], "count": 0}
 
-    # Convert to records
-    jobs_list = jobs_df.to_dict(orient="records")
-
-    # Clean up NaN values for JSON serialization
-    for job in jobs_list:
-        for key, value in job.items():
-            if isinstance(value, float) and str(value) == "nan":
-                job[key] = None
+    # Convert to records, replacing NaN/NaT with None for JSON serialization
+    jobs_list = jobs_df.astype(object).where(jobs_df.notna(), None).to_dict(orient="records")
 
-    # Deduplicate jobs
-    jobs_list = deduplicate_jobs(jobs_list)
+    # Deduplicate jobs (and drop previously discovered ones if requested)
+    seen_jobs = SeenJobsFilter.load()
+    original_count = len(jobs_list)
+    jobs_list = deduplicate_jobs(jobs_list, seen_jobs if new_only else None)
+    if new_only and len(jobs_list) < original_count:
+        print(f"Skipped {original_count - len(jobs_list)} duplicate or previously seen jobs")
 
     # Apply targets configuration (tier info, priority, exclusions)
-    targets = load_targets(locale=locale)
+    targets, targets_lookup = load_compiled_targets(locale=locale)
     if targets:
         original_count = len(jobs_list)
-        jobs_list = apply_targets_filter(jobs_list, targets)
+        jobs_list = apply_targets_filter(jobs_list, targets, targets_lookup)
         filtered_count = original_count - len(jobs_list)
         if filtered_count > 0:
             print(f"Filtered {filtered_count} jobs based on exclusions")
@@ -435,7 +729,7 @@ def search_jobs(
     }
 
     # Save outputs
-    output_dir = Path(__file__).parent.parent.parent / "jobs" / "discovered"
+    output_dir = DISCOVERED_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -452,6 +746,14 @@ def search_jobs(
         jobs_df.to_csv(csv_path, index=False)
         print(f"Saved CSV: {csv_path}")
 
+    # Marked only once the results are on disk, so a failed run doesn't hide
+    # jobs from the next --new-only search
+    for job in jobs_list:
+        url_key = job.get("job_url") or job.get("url")
+        if url_key:
+            seen_jobs.add(url_key)
+    seen_jobs.save()
+
     return result
 
 
@@ -552,6 +854,11 @@ Examples:
         default=None,
         help="Locale for region-specific config (e.g., 'israel')",
     )
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Skip jobs already discovered in previous runs",
+    )
     parser.add_argument(
         "-f",
         "--format",
@@ -578,6 +885,7 @@ Examples:
         is_remote=not args.include_onsite,
         output_format=args.format,
         locale=args.locale,
+        new_only=args.new_only,
     )
 
     if not args.quiet:
@@ -11,16 +11,164 @@ Manages LinkedIn content strategy:
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
 import random
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta
+import re
+import sqlite3
+import string
+import sys
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import yaml
 
+# Mon=0, Wed=2, Fri=4
+_POST_DAYS = (0, 2, 4)
+_WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# libyaml-backed loader when PyYAML was built with it (same safe subset)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Prefer orjson for post/calendar JSON I/O; fall back to the stdlib encoder
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize *data* to a compact JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+
+def _loads_json(text: str) -> Any:
+    """Parse a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write *data* to *path* as indented JSON."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+@lru_cache(maxsize=4)
+def _load_profile_cached(path: str, _mtime_ns: int) -> dict[str, Any]:
+    """Parse the master profile once per (path, mtime).
+
+    *_mtime_ns* only participates in the cache key so edits to the profile
+    invalidate the entry.
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data if isinstance(data, dict) else {}
+
+
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Pre-tokenize a str.format template into (literal, field_name) pairs."""
+    return tuple(
+        (literal, field_name) for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _render_template(compiled: tuple[tuple[str, str | None], ...], values: dict[str, Any]) -> str:
+    """
+    Splice *values* into a compiled template.
+
+    Fields missing from *values* are left as ``{field}`` placeholders so the
+    draft can be finished by hand.
+    """
+    parts: list[str] = []
+    for literal, field_name in compiled:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(str(values.get(field_name, f"{{{field_name}}}")))
+    return "".join(parts)
+
+
+def _draw_calendar(
+    weeks: int,
+    monday: np.datetime64,
+    weights: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw a whole posting horizon in one vectorized pass.
+
+    Picks 2-3 posts per week spread across Mon/Wed/Fri, then one pillar per
+    post from *weights*. Returns ``(dates, days, type_idx)`` where *dates* are
+    ISO date strings and *days* are weekday indices.
+    """
+    posts_per_week = rng.integers(2, 4, size=weeks)
+    day_order = rng.permuted(np.tile(_POST_DAYS, (weeks, 1)), axis=1)
+    keep = np.arange(len(_POST_DAYS)) < posts_per_week[:, None]
+    # Dropped slots become 7 so they sort after every real weekday
+    week_days = np.sort(np.where(keep, day_order, 7), axis=1)
+    week_idx, slot_idx = np.nonzero(week_days < 7)
+    days = week_days[week_idx, slot_idx]
+    type_idx = rng.choice(len(weights), size=len(days), p=weights)
+    dates = (monday + week_idx * 7 + days).astype(str)
+    return dates, days, type_idx
+
+
+def _same_contents(path: Path, chunks: list[bytes]) -> bool:
+    """Whether *path* already holds exactly *chunks* (size is checked first)."""
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        return False
+    return size == sum(len(chunk) for chunk in chunks) and path.read_bytes() == b"".join(chunks)
+
+
+def _write_chunks(path: Path, chunks: list[bytes]) -> None:
+    """
+    Write *chunks* to *path* with one writev(2) instead of joining them first.
+
+    Falls back to a single joined write where os.writev is unavailable
+    (Windows).
+    """
+    if not hasattr(os, "writev"):
+        path.write_bytes(b"".join(chunks))
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(len(chunk) for chunk in chunks):
+            # Short write: finish the remainder with plain write(2) calls
+            remaining = memoryview(b"".join(chunks))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining) :]
+    finally:
+        os.close(fd)
+
 
 class PostType(Enum):
     TECHNICAL_INSIGHT = "technical_insight"
@@ -33,7 +181,7 @@ class PostType(Enum):
     CASE_STUDY = "case_study"
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInPost:
     """Represents a LinkedIn post"""
 
@@ -48,11 +196,19 @@ class LinkedInPost:
     created_at: datetime
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d["type"] = self.type.value
-        d["scheduled_date"] = self.scheduled_date.isoformat() if self.scheduled_date else None
-        d["created_at"] = self.created_at.isoformat()
-        return d
+        # Built by hand rather than via asdict(): the dict is serialized right
+        # away, so the recursive deep copy of hashtags/engagement is wasted work
+        return {
+            "id": self.id,
+            "type": self.type.value,
+            "title": self.title,
+            "content": self.content,
+            "hashtags": self.hashtags,
+            "scheduled_date": self.scheduled_date.isoformat() if self.scheduled_date else None,
+            "status": self.status,
+            "engagement": self.engagement,
+            "created_at": self.created_at.isoformat(),
+        }
 
 
 class LinkedInContentManager:
@@ -60,61 +216,61 @@ class LinkedInContentManager:
     Manages LinkedIn content creation and scheduling.
     """
 
-    _DEFAULT_HASHTAG_SETS: dict[str, list[str]] = {
-        "primary": ["#AI", "#MachineLearning", "#LLM"],
-        "secondary": ["#MultiAgentSystems", "#AIEngineering", "#MLOps", "#BuildInPublic"],
-        "niche": ["#RAG", "#LLMOps", "#Kubernetes", "#DistributedSystems"],
+    _DEFAULT_HASHTAG_SETS: dict[str, tuple[str, ...]] = {
+        "primary": ("#AI", "#MachineLearning", "#LLM"),
+        "secondary": ("#MultiAgentSystems", "#AIEngineering", "#MLOps", "#BuildInPublic"),
+        "niche": ("#RAG", "#LLMOps", "#Kubernetes", "#DistributedSystems"),
     }
 
-    _DEFAULT_HOOKS: dict[str, list[str]] = {
-        "multi_agent": [
+    _DEFAULT_HOOKS: dict[str, tuple[str, ...]] = {
+        "multi_agent": (
             "Multi-agent systems don't fail gracefully. They fail spectacularly.",
             "The hardest part of building agent systems isn't the AI. It's everything else.",
             "Your agent orchestrator is the new monolith.",
             "LangGraph and CrewAI are great... until you need enterprise features.",
-        ],
-        "llmops": [
+        ),
+        "llmops": (
             "Your LLM costs are 3x what they should be.",
             "Observability for AI is not optional anymore.",
             "The gap between demo and production is a chasm.",
             "Your prompt is probably not the problem.",
-        ],
-        "career": [
+        ),
+        "career": (
             "The best career advice I ignored (and why I regret it)",
             "What I wish I knew before my first AI job",
             "Why I left a stable job to build my own project",
-        ],
+        ),
     }
 
-    _DEFAULT_TOPIC_SUGGESTIONS: dict[str, list[str]] = {
-        "technical_insight": [
+    _DEFAULT_TOPIC_SUGGESTIONS: dict[str, tuple[str, ...]] = {
+        "technical_insight": (
             "Multi-agent coordination patterns",
             "Token efficiency in LLM systems",
             "Service mesh for AI platforms",
             "RAG optimization techniques",
             "LLMOps best practices",
-        ],
-        "build_in_public": [
+        ),
+        "build_in_public": (
             "Project weekly update",
             "New feature implementation",
             "Architecture decision",
             "Performance optimization",
             "User feedback integration",
-        ],
-        "industry_commentary": [
+        ),
+        "industry_commentary": (
             "Latest agent framework comparison",
             "AI infrastructure trends",
             "Production AI challenges",
             "Research paper discussion",
             "Tool/framework review",
-        ],
-        "career_update": [
+        ),
+        "career_update": (
             "Job search progress",
             "Skill development",
             "Milestone celebration",
             "Learning reflection",
             "Community involvement",
-        ],
+        ),
     }
 
     _DEFAULT_POST_IDEAS: dict[str, list[str]] = {
@@ -148,6 +304,26 @@ class LinkedInContentManager:
         "default": "AI Infrastructure Engineer | Building [Project] | Open to Opportunities",
     }
 
+    # Job-description keyword -> headline template key
+    _HEADLINE_KEYWORDS: dict[str, str] = {
+        "research": "research",
+        "phd": "research",
+        "founding": "founding",
+        "startup": "founding",
+        "0-to-1": "founding",
+        "platform": "platform",
+        "infrastructure": "platform",
+    }
+    _HEADLINE_KEYWORD_RE = re.compile("|".join(map(re.escape, _HEADLINE_KEYWORDS)))
+
+    # Template key -> reason, in priority order when several keys match
+    _HEADLINE_REASONS: dict[str, str] = {
+        "research": "Job emphasizes research; switching to research-focused headline",
+        "founding": "Job is founding/startup role; emphasizing entrepreneurial experience",
+        "platform": "Job emphasizes platform; highlighting infrastructure experience",
+        "default": "Switching to job hunting headline for visibility",
+    }
+
     _DEFAULT_CONNECTION_TEMPLATES: dict[str, str] = {
         "recruiter": "Hi {first_name}, I saw {company} is hiring for {role} roles. I've been building enterprise-grade AI systems and would love to learn more! Best regards",
         "hiring_manager": "Hi {first_name}, Just applied for the {role} role at {company}. My experience building production AI systems aligns well. Would love to connect!",
@@ -254,6 +430,48 @@ Thanks to everyone who's been part of this journey.
 """,
     }
 
+    # Parsed (and stripped) once so drafting never re-runs the format-string
+    # parser or re-scans the rendered post for surrounding whitespace
+    _COMPILED_TEMPLATES = {pt: _compile_template(t.strip()) for pt, t in POST_TEMPLATES.items()}
+
+    # With no caller values only the hashtags vary, so each template is also
+    # pre-rendered and split around its {hashtags} field
+    _BARE_TEMPLATES = {
+        pt: tuple(_render_template(compiled, {}).split("{hashtags}"))
+        for pt, compiled in _COMPILED_TEMPLATES.items()
+    }
+
+    # Process-wide draft counter appended to post ids
+    _post_seq = itertools.count()
+
+    # Content pillars distribution for the calendar
+    _PILLARS: dict[PostType, float] = {
+        PostType.TECHNICAL_INSIGHT: 0.4,  # 40%
+        PostType.BUILD_IN_PUBLIC: 0.3,  # 30%
+        PostType.INDUSTRY_COMMENTARY: 0.2,  # 20%
+        PostType.CAREER_UPDATE: 0.1,  # 10%
+    }
+    _PILLAR_TYPES = tuple(_PILLARS)
+    _PILLAR_WEIGHTS = np.fromiter(_PILLARS.values(), dtype=np.float64)
+    _PILLAR_WEIGHTS /= _PILLAR_WEIGHTS.sum()
+    _PILLAR_WEIGHTS.flags.writeable = False
+
+    # Post types that get #BuildInPublic / extra niche hashtags
+    _BIP_TYPES = frozenset({PostType.BUILD_IN_PUBLIC, PostType.CAREER_UPDATE})
+    _NICHE_TYPES = frozenset({PostType.TECHNICAL_INSIGHT, PostType.TUTORIAL})
+
+    POSTS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS posts (
+        id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,  -- draft, scheduled, published
+        type TEXT NOT NULL,
+        scheduled_date TEXT,
+        payload TEXT NOT NULL  -- JSON of LinkedInPost.to_dict()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_posts_status ON posts(status);
+    """
+
     def __init__(self, project_root: str = ".") -> None:
         self.root = Path(project_root)
         self.profile_path = self.root / "config" / "master_profile.yaml"
@@ -261,128 +479,302 @@ Thanks to everyone who's been part of this journey.
 
         # Resolve profile-driven content with defaults
         linkedin = self.profile.get("linkedin_content", {})
-        self.HASHTAG_SETS = linkedin.get("hashtags", self._DEFAULT_HASHTAG_SETS)
-        self.HOOKS = linkedin.get("hooks", self._DEFAULT_HOOKS)
+        # Pools are frozen to tuples once here; hashtags are interned since the
+        # same handful of short strings is compared and deduped on every draft.
+        # Sets the profile leaves out fall back to the defaults one by one
+        self.HASHTAG_SETS: dict[str, tuple[str, ...]] = {
+            key: tuple(sys.intern(tag) for tag in tags)
+            for key, tags in {
+                **self._DEFAULT_HASHTAG_SETS,
+                **linkedin.get("hashtags", {}),
+            }.items()
+        }
+        self.HOOKS: dict[str, tuple[str, ...]] = {
+            key: tuple(hooks) for key, hooks in linkedin.get("hooks", self._DEFAULT_HOOKS).items()
+        }
+        self._topic_pools: dict[str, tuple[str, ...]] = {
+            key: tuple(topics)
+            for key, topics in {
+                **self._DEFAULT_TOPIC_SUGGESTIONS,
+                **linkedin.get("topic_suggestions", {}),
+            }.items()
+        }
 
-        self.posts_dir = self.root / "linkedin" / "posts"
-        self.posts_dir.mkdir(parents=True, exist_ok=True)
+        # Post ideas merged once (profile first, then defaults) per idea type
+        profile_ideas = linkedin.get("post_ideas", {})
+        self._post_ideas: dict[PostType, tuple[str, ...]] = {
+            pt: tuple(profile_ideas.get(pt.value, self._DEFAULT_POST_IDEAS.get(pt.value, [])))
+            for pt in (
+                PostType.TECHNICAL_INSIGHT,
+                PostType.BUILD_IN_PUBLIC,
+                PostType.INDUSTRY_COMMENTARY,
+            )
+        }
+
+        # Topic pools per calendar pillar, aligned with _PILLAR_TYPES
+        self._pillar_pools = tuple(self._topic_suggestions(pt) for pt in self._PILLAR_TYPES)
+        self._pillar_pool_sizes = np.fromiter(map(len, self._pillar_pools), dtype=np.int64)
+
+        self._primary_tags = self.HASHTAG_SETS["primary"]
+        self._secondary_tags = self.HASHTAG_SETS["secondary"]
+        self._niche_tags = self.HASHTAG_SETS["niche"]
+
+        # Private generators so callers running managers in parallel don't
+        # contend on the module-level random state; linkedin_content.random_seed
+        # makes hashtags, hooks, topics and calendars reproducible
+        seed = linkedin.get("random_seed")
+        self._rng = random.Random(seed)
+        # Batch draws (content calendar) come from one NumPy generator
+        self._np_rng = np.random.default_rng(seed)
 
+        self.posts_dir = self.root / "linkedin" / "posts"
         self.drafts_dir = self.posts_dir / "drafts"
         self.scheduled_dir = self.posts_dir / "scheduled"
         self.published_dir = self.posts_dir / "published"
 
-        for d in [self.drafts_dir, self.scheduled_dir, self.published_dir]:
-            d.mkdir(exist_ok=True)
+        # parents=True on the first leaf creates posts_dir as well, so the
+        # three status directories are the only mkdir calls needed
+        for d in (self.drafts_dir, self.scheduled_dir, self.published_dir):
+            d.mkdir(parents=True, exist_ok=True)
 
         self.calendar_path = self.posts_dir / "content_calendar.json"
         self.analytics_path = self.root / "linkedin" / "analytics" / "engagement.json"
 
+        # Post records live in one SQLite store; markdown drafts stay on disk
+        # next to it for hand editing
+        self.db_path = self.posts_dir / "posts.db"
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the posts store and import any legacy per-post JSON files."""
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.POSTS_SCHEMA)
+        self._import_legacy_posts()
+
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager for posts store connections"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _import_legacy_posts(self) -> None:
+        """
+        Move posts saved as one JSON file each (older layout) into the store.
+
+        Files that aren't post records are skipped with a warning. Imported
+        files are renamed to ``.json.imported`` once the import is committed
+        and their post is in the store, so nothing is lost if it fails midway.
+        """
+        legacy: list[tuple[Path, dict[str, Any]]] = []
+        for directory in (self.drafts_dir, self.scheduled_dir, self.published_dir):
+            for path in directory.glob("*.json"):
+                try:
+                    data = _read_json(path)
+                except (OSError, ValueError) as e:
+                    warnings.warn(f"Skipping unreadable legacy post {path}: {e}", stacklevel=2)
+                    continue
+                if not (
+                    isinstance(data, dict)
+                    and all(isinstance(data.get(key), str) for key in ("id", "status", "type"))
+                ):
+                    warnings.warn(f"Skipping {path}: not a post record", stacklevel=2)
+                    continue
+                legacy.append((path, data))
+        if not legacy:
+            return
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO posts VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        data["id"],
+                        data["status"],
+                        data["type"],
+                        data.get("scheduled_date"),
+                        _dumps_json(data),
+                    )
+                    for _, data in legacy
+                ],
+            )
+
+        # The import is committed; retire only files whose post is stored
+        with self._get_connection() as conn:
+            for path, data in legacy:
+                if conn.execute("SELECT 1 FROM posts WHERE id = ?", (data["id"],)).fetchone():
+                    path.rename(path.with_name(f"{path.name}.imported"))
+
     def _load_profile(self) -> dict[str, Any]:
-        """Load master profile for dynamic content."""
+        """
+        Load master profile for dynamic content.
+
+        The parsed profile is cached per process and shared between managers,
+        so it must not be mutated.
+        """
         if self.profile_path.exists():
-            with open(self.profile_path) as f:
-                data = yaml.safe_load(f)
-            return data if isinstance(data, dict) else {}
+            return _load_profile_cached(
+                str(self.profile_path), self.profile_path.stat().st_mtime_ns
+            )
         return {}
 
-    def create_post_draft(self, post_type: PostType, **kwargs: Any) -> LinkedInPost:
+    def create_post_draft(
+        self, post_type: PostType, *, write_markdown: bool = True, **kwargs: Any
+    ) -> LinkedInPost:
         """
         Create a new post draft from template.
-        """
-        template = self.POST_TEMPLATES.get(post_type, "")
-
-        # Fill template with provided kwargs
-        content = template.format(**kwargs) if kwargs else template
 
-        # Select hashtags
+        Pass ``write_markdown=False`` from programmatic callers that never open
+        the editable ``.md`` companion; the draft is still stored.
+        """
+        # Select hashtags, then fill template with them and provided kwargs
         hashtags = self._select_hashtags(post_type)
-        content = content.replace("{hashtags}", " ".join(hashtags))
+        tags = " ".join(hashtags)
+        if kwargs:
+            compiled = self._COMPILED_TEMPLATES.get(post_type, ())
+            content = _render_template(compiled, {**kwargs, "hashtags": tags})
+        else:
+            content = tags.join(self._BARE_TEMPLATES.get(post_type, ("",)))
 
         # Create post object
-        post_id = f"{post_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Formatted field-by-field; strftime re-parses its format string every call
+        # The sequence suffix keeps drafts created within the same second apart
+        now = datetime.now()
+        post_id = (
+            f"{post_type.value}_{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"_{now.hour:02d}{now.minute:02d}{now.second:02d}_{next(self._post_seq):04d}"
+        )
 
         post = LinkedInPost(
             id=post_id,
             type=post_type,
             title=kwargs.get("title", f"{post_type.value} post"),
-            content=content.strip(),
+            content=content,
             hashtags=hashtags,
             scheduled_date=None,
             status="draft",
             engagement=None,
-            created_at=datetime.now(),
+            created_at=now,
         )
 
         # Save draft
-        self._save_post(post, self.drafts_dir)
+        self._save_post(post, self.drafts_dir, write_markdown=write_markdown)
 
         return post
 
     def _select_hashtags(self, post_type: PostType, count: int = 5) -> list[str]:
         """Select appropriate hashtags for post type."""
-        hashtags = self.HASHTAG_SETS["primary"].copy()
+        hashtags = list(self._primary_tags)
 
-        if post_type in [PostType.BUILD_IN_PUBLIC, PostType.CAREER_UPDATE]:
+        if post_type in self._BIP_TYPES:
             hashtags.append("#BuildInPublic")
 
-        if post_type in [PostType.TECHNICAL_INSIGHT, PostType.TUTORIAL]:
-            hashtags.extend(random.sample(self.HASHTAG_SETS["niche"], 2))
+        if post_type in self._NICHE_TYPES:
+            hashtags += self._rng.sample(self._niche_tags, 2)
 
-        hashtags.extend(random.sample(self.HASHTAG_SETS["secondary"], 2))
+        hashtags += self._rng.sample(self._secondary_tags, 2)
 
-        return list(set(hashtags))[:count]
+        # dict.fromkeys dedups while keeping primary tags first
+        return list(dict.fromkeys(hashtags))[:count]
 
-    def _save_post(self, post: LinkedInPost, directory: Path) -> None:
-        """Save post to file."""
-        filepath = directory / f"{post.id}.json"
-        with open(filepath, "w") as f:
-            json.dump(post.to_dict(), f, indent=2)
+    def _save_post(self, post: LinkedInPost, directory: Path, write_markdown: bool = True) -> None:
+        """
+        Save post to the store plus (optionally) a markdown version for easy editing.
+
+        Both payloads are rendered before anything is written, so a rendering
+        error never leaves a stored post without its markdown companion. An
+        existing markdown file with identical contents is left untouched.
+        """
+        data = post.to_dict()
+        md_chunks = (
+            [chunk.encode("utf-8") for chunk in self._render_markdown(post, data["created_at"])]
+            if write_markdown
+            else []
+        )
 
-        # Also save markdown version for easy editing
-        md_path = directory / f"{post.id}.md"
-        md_content = f"""# {post.title}
+        with self._get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?)",
+                (post.id, post.status, data["type"], data["scheduled_date"], _dumps_json(data)),
+            )
+
+        if write_markdown:
+            md_path = directory / f"{post.id}.md"
+            if not _same_contents(md_path, md_chunks):
+                _write_chunks(md_path, md_chunks)
+
+    @staticmethod
+    def _render_markdown(post: LinkedInPost, created: str) -> tuple[str, str, str]:
+        """
+        Render the editable markdown version of a post as (header, content, footer).
+
+        *created* is the ISO timestamp already formatted for the stored record.
+        """
+        header = f"""# {post.title}
 
 **Type**: {post.type.value}
 **Status**: {post.status}
-**Created**: {post.created_at.isoformat()}
+**Created**: {created}
 
 ---
 
-{post.content}
+"""
+        footer = f"""
 
 ---
 
 **Hashtags**: {" ".join(post.hashtags)}
 """
-        md_path.write_text(md_content)
+        return header, post.content, footer
 
     def schedule_post(self, post_id: str, scheduled_date: datetime) -> None:
         """Schedule a draft post for publishing."""
-        # Find post in drafts
-        draft_path = self.drafts_dir / f"{post_id}.json"
-
-        if not draft_path.exists():
-            raise FileNotFoundError(f"Post {post_id} not found in drafts")
-
-        with open(draft_path) as f:
-            data = json.load(f)
-
-        # Update status and date
-        data["status"] = "scheduled"
-        data["scheduled_date"] = scheduled_date.isoformat()
-
-        # Move to scheduled directory
-        scheduled_path = self.scheduled_dir / f"{post_id}.json"
-        with open(scheduled_path, "w") as f:
-            json.dump(data, f, indent=2)
-
-        # Remove from drafts
-        draft_path.unlink()
+        # Update status and date in one statement; json_set patches the stored
+        # payload in place so it never round-trips through Python
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE posts
+                SET status = 'scheduled',
+                    scheduled_date = :date,
+                    payload = json_set(
+                        payload, '$.status', 'scheduled', '$.scheduled_date', :date
+                    )
+                WHERE id = :id AND status = 'draft'
+                """,
+                {"id": post_id, "date": scheduled_date.isoformat()},
+            )
+            if cursor.rowcount == 0:
+                raise FileNotFoundError(f"Post {post_id} not found in drafts")
+
+        # Remove the editable draft
         (self.drafts_dir / f"{post_id}.md").unlink(missing_ok=True)
 
         # Update calendar
         self._update_calendar(post_id, scheduled_date)
 
+    def get_post(self, post_id: str) -> dict[str, Any] | None:
+        """Get a stored post by ID."""
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT payload FROM posts WHERE id = ?", (post_id,)).fetchone()
+        return _loads_json(row[0]) if row else None
+
+    def list_posts(self, status: str | None = None) -> list[dict[str, Any]]:
+        """List stored posts, optionally filtered by status (draft, scheduled, published)."""
+        with self._get_connection() as conn:
+            if status:
+                rows = conn.execute(
+                    "SELECT payload FROM posts WHERE status = ? ORDER BY id", (status,)
+                ).fetchall()
+            else:
+                rows = conn.execute("SELECT payload FROM posts ORDER BY id").fetchall()
+        return [_loads_json(row[0]) for row in rows]
+
     def _update_calendar(self, post_id: str, scheduled_date: datetime) -> None:
         """Update content calendar."""
         calendar = self._load_calendar()
@@ -391,14 +783,12 @@ Thanks to everyone who's been part of this journey.
             {"id": post_id, "date": scheduled_date.isoformat(), "status": "scheduled"}
         )
 
-        with open(self.calendar_path, "w") as f:
-            json.dump(calendar, f, indent=2)
+        _write_json(self.calendar_path, calendar)
 
     def _load_calendar(self) -> dict[str, Any]:
         """Load content calendar."""
         if self.calendar_path.exists():
-            with open(self.calendar_path) as f:
-                data = json.load(f)
+            data = _read_json(self.calendar_path)
             if isinstance(data, dict):
                 return data
         return {"posts": [], "strategy": {}}
@@ -410,94 +800,57 @@ Thanks to everyone who's been part of this journey.
         calendar = []
         start_date = datetime.now()
 
-        # Content pillars distribution
-        pillars = {
-            PostType.TECHNICAL_INSIGHT: 0.4,  # 40%
-            PostType.BUILD_IN_PUBLIC: 0.3,  # 30%
-            PostType.INDUSTRY_COMMENTARY: 0.2,  # 20%
-            PostType.CAREER_UPDATE: 0.1,  # 10%
-        }
-
-        # Schedule 2-3 posts per week
-        for week in range(weeks):
-            week_start = start_date + timedelta(weeks=week)
-            posts_this_week = random.randint(2, 3)
-
-            # Distribute posts across Mon, Wed, Fri
-            post_days = random.sample([0, 2, 4], posts_this_week)  # Mon=0, Wed=2, Fri=4
-
-            for day in sorted(post_days):
-                post_date = week_start + timedelta(days=day - week_start.weekday())
-
-                # Select post type based on distribution
-                post_type = random.choices(list(pillars.keys()), weights=list(pillars.values()))[0]
-
-                calendar.append(
-                    {
-                        "date": post_date.strftime("%Y-%m-%d"),
-                        "day": ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][
-                            post_date.weekday()
-                        ],
-                        "type": post_type.value,
-                        "topic_suggestion": self._get_topic_suggestion(post_type),
-                        "status": "planned",
-                    }
-                )
+        # Draw the whole horizon at once, then pick each post's topic from
+        # its pillar's suggestion pool with one more batched draw
+        rng = self._np_rng
+        pillar_types = self._PILLAR_TYPES
+        pools = self._pillar_pools
+        monday = np.datetime64(start_date.date(), "D") - start_date.weekday()
+        dates, days, type_idx = _draw_calendar(weeks, monday, self._PILLAR_WEIGHTS, rng)
+        topic_idx = rng.integers(0, self._pillar_pool_sizes[type_idx])
+
+        for date, day, t, k in zip(dates, days, type_idx, topic_idx):
+            calendar.append(
+                {
+                    "date": str(date),
+                    "day": _WEEKDAY_NAMES[day],
+                    "type": pillar_types[t].value,
+                    "topic_suggestion": pools[t][k],
+                    "status": "planned",
+                }
+            )
 
         # Format as table
-        output = "# Content Calendar\n\n"
-        output += f"Generated: {datetime.now().strftime('%Y-%m-%d')}\n"
-        output += f"Period: Next {weeks} weeks\n\n"
-
-        output += "| Date | Day | Type | Topic Suggestion | Status |\n"
-        output += "|------|-----|------|------------------|--------|\n"
-
-        for entry in calendar:
-            output += f"| {entry['date']} | {entry['day']} | {entry['type']} | {entry['topic_suggestion']} | {entry['status']} |\n"
+        row = "| {date} | {day} | {type} | {topic_suggestion} | {status} |\n".format_map
+        parts = [
+            "# Content Calendar\n\n",
+            f"Generated: {start_date.year:04d}-{start_date.month:02d}-{start_date.day:02d}\n",
+            f"Period: Next {weeks} weeks\n\n",
+            "| Date | Day | Type | Topic Suggestion | Status |\n",
+            "|------|-----|------|------------------|--------|\n",
+        ]
+        parts.extend(row(entry) for entry in calendar)
+        output = "".join(parts)
 
         # Save calendar
-        with open(self.calendar_path, "w") as f:
-            json.dump({"posts": calendar, "generated": datetime.now().isoformat()}, f, indent=2)
+        _write_json(self.calendar_path, {"posts": calendar, "generated": start_date.isoformat()})
 
         return output
 
+    def _topic_suggestions(self, post_type: PostType) -> tuple[str, ...]:
+        """Topic suggestion pool for a post type (profile first, then defaults)."""
+        return self._topic_pools.get(post_type.value, ("General update",))
+
     def _get_topic_suggestion(self, post_type: PostType) -> str:
         """Get topic suggestion based on post type."""
-        profile_suggestions = self.profile.get("linkedin_content", {}).get("topic_suggestions", {})
-
-        # Map PostType enum to profile key
-        type_key = post_type.value  # e.g. "technical_insight"
-
-        # Try profile first, then defaults
-        suggestions = profile_suggestions.get(
-            type_key,
-            self._DEFAULT_TOPIC_SUGGESTIONS.get(type_key, ["General update"]),
-        )
-
-        result: str = random.choice(suggestions)
+        result: str = self._rng.choice(self._topic_suggestions(post_type))
         return result
 
     def get_post_ideas(self, post_type: PostType | None = None) -> list[str]:
         """Generate post ideas based on project and career context."""
-        profile_ideas = self.profile.get("linkedin_content", {}).get("post_ideas", {})
-
-        # Build ideas dict merging profile with defaults
-        ideas: dict[PostType, list[str]] = {}
-        for pt in [
-            PostType.TECHNICAL_INSIGHT,
-            PostType.BUILD_IN_PUBLIC,
-            PostType.INDUSTRY_COMMENTARY,
-        ]:
-            type_key = pt.value
-            ideas[pt] = profile_ideas.get(type_key, self._DEFAULT_POST_IDEAS.get(type_key, []))
-
         if post_type:
-            return ideas.get(post_type, [])
-
-        all_ideas: list[str] = []
-        for type_ideas in ideas.values():
-            all_ideas.extend(type_ideas)
-        return all_ideas
+            return list(self._post_ideas.get(post_type, ()))
+        return list(itertools.chain.from_iterable(self._post_ideas.values()))
 
     def analyze_engagement(self) -> str:
         """Analyze post engagement and provide recommendations."""
@@ -505,24 +858,29 @@ Thanks to everyone who's been part of this journey.
         if not self.analytics_path.exists():
             return "No engagement data available yet. Start posting to collect data!"
 
-        with open(self.analytics_path) as f:
-            analytics = json.load(f)
+        analytics = _read_json(self.analytics_path)
 
         # Generate report
-        report = "# Engagement Analysis\n\n"
+        parts = ["# Engagement Analysis\n\n"]
 
         if "posts" in analytics:
-            total_posts = len(analytics["posts"])
-            total_likes = sum(p.get("likes", 0) for p in analytics["posts"])
-            total_comments = sum(p.get("comments", 0) for p in analytics["posts"])
-
-            report += f"**Total Posts**: {total_posts}\n"
-            report += f"**Total Likes**: {total_likes}\n"
-            report += f"**Total Comments**: {total_comments}\n"
-            report += f"**Avg Likes/Post**: {total_likes / max(total_posts, 1):.1f}\n"
-            report += f"**Avg Comments/Post**: {total_comments / max(total_posts, 1):.1f}\n"
-
-        return report
+            posts = analytics["posts"]
+            total_posts = len(posts)
+            # One pass over the posts for both totals
+            total_likes = total_comments = 0
+            for p in posts:
+                total_likes += p.get("likes", 0)
+                total_comments += p.get("comments", 0)
+
+            parts += [
+                f"**Total Posts**: {total_posts}\n",
+                f"**Total Likes**: {total_likes}\n",
+                f"**Total Comments**: {total_comments}\n",
+                f"**Avg Likes/Post**: {total_likes / max(total_posts, 1):.1f}\n",
+                f"**Avg Comments/Post**: {total_comments / max(total_posts, 1):.1f}\n",
+            ]
+
+        return "".join(parts)
 
     def suggest_headline_update(
         self,
@@ -542,21 +900,15 @@ Thanks to everyone who's been part of this journey.
         templates = self.profile.get("linkedin_content", {}).get(
             "headline_templates", self._DEFAULT_HEADLINE_TEMPLATES
         )
-        jd_lower = job_description.lower()
-
-        # Check what to emphasize
-        if "research" in jd_lower or "phd" in jd_lower:
-            suggested = templates.get("research", self._DEFAULT_HEADLINE_TEMPLATES["research"])
-            reason = "Job emphasizes research; switching to research-focused headline"
-        elif "founding" in jd_lower or "startup" in jd_lower or "0-to-1" in jd_lower:
-            suggested = templates.get("founding", self._DEFAULT_HEADLINE_TEMPLATES["founding"])
-            reason = "Job is founding/startup role; emphasizing entrepreneurial experience"
-        elif "platform" in jd_lower or "infrastructure" in jd_lower:
-            suggested = templates.get("platform", self._DEFAULT_HEADLINE_TEMPLATES["platform"])
-            reason = "Job emphasizes platform; highlighting infrastructure experience"
-        else:
-            suggested = templates.get("default", self._DEFAULT_HEADLINE_TEMPLATES["default"])
-            reason = "Switching to job hunting headline for visibility"
+        # One scan collects every matched group; priority is applied afterwards
+        matched = {
+            self._HEADLINE_KEYWORDS[keyword]
+            for keyword in self._HEADLINE_KEYWORD_RE.findall(job_description.lower())
+        }
+        key = next((k for k in self._HEADLINE_REASONS if k in matched), "default")
+
+        suggested = templates.get(key, self._DEFAULT_HEADLINE_TEMPLATES[key])
+        reason = self._HEADLINE_REASONS[key]
 
         return {"current": current_headline, "suggested": suggested, "reason": reason}
 
@@ -597,8 +949,8 @@ Thanks to everyone who's been part of this journey.
 
     def get_hook(self, topic: str = "multi_agent") -> str:
         """Get a random attention-grabbing hook for a topic."""
-        hooks: list[str] = self.HOOKS.get(topic, self.HOOKS["multi_agent"])
-        result: str = random.choice(hooks)
+        hooks = self.HOOKS.get(topic, self.HOOKS["multi_agent"])
+        result: str = self._rng.choice(hooks)
         return result
 
 
@@ -3,26 +3,41 @@ Application submission module.
 
 Exports:
     apply_to_job: Main entry point for job application
+    apply_to_jobs: Apply to several jobs sharing one browser
+    PlaywrightSession: Shared Playwright browser for batch submissions
+    warm_browser: Prelaunch the default browser before the first submission
+    drain_pending_io: Wait for screenshot writes queued by submissions
     submit_application: Submit job application using Playwright automation
     validate_submission: Validate submission requirements before applying
+    validate_submissions: Validate many submissions with concurrent DB checks
     get_resume_variant: Get the resume variant for a specific job
     record_application: Save application record
     AnswerResolver: Resolves Easy Apply questions from master profile
 """
 
 from .application_submitter import (
+    PlaywrightSession,
     apply_to_job,
+    apply_to_jobs,
+    drain_pending_io,
     get_resume_variant,
     record_application,
     submit_application,
     validate_submission,
+    validate_submissions,
+    warm_browser,
 )
 from .easy_apply_answers import AnswerResolver
 
 __all__ = [
     "apply_to_job",
+    "apply_to_jobs",
+    "PlaywrightSession",
+    "warm_browser",
+    "drain_pending_io",
     "submit_application",
     "validate_submission",
+    "validate_submissions",
     "get_resume_variant",
     "record_application",
     "AnswerResolver",
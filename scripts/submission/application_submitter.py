@@ -9,68 +9,252 @@ Supports two modes:
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from scripts.analysis.job_analyzer import ANALYZED_INDEX_NAME
+from scripts.submission.easy_apply_answers import CONFIG_DIR as ANSWERS_CONFIG_DIR
+from scripts.submission.easy_apply_answers import AnswerResolver
 
 # Configuration
+ANALYZED_DIR = Path("jobs/analyzed")
 APPLIED_DIR = Path("jobs/applied")
 CONFIG_DIR = Path("config")
 RESUME_DIR = Path("resume")
 SCREENSHOTS_DIR = Path("screenshots")
 
-# Try to import Playwright
+# Company name -> filename slug (spaces to underscores), one C-level pass
+_COMPANY_SLUG = str.maketrans(" ", "_")
+
+# libyaml-backed loader when PyYAML was built with it (same safe subset)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Prefer orjson for application records; fall back to the stdlib encoder
 try:
-    from playwright.sync_api import Locator, Page, sync_playwright
+    import orjson
 
-    PLAYWRIGHT_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Locator, Page, Route
+
+# Playwright (and its greenlet driver) is imported on first browser use, so
+# dry runs and MCP-mode callers never pay for it. None until probed.
+PLAYWRIGHT_AVAILABLE: bool | None = None
+
+
+def _ensure_playwright() -> bool:
+    """Import Playwright on first call and record whether it is installed."""
+    global PLAYWRIGHT_AVAILABLE
+    if PLAYWRIGHT_AVAILABLE is None:
+        try:
+            import playwright.sync_api  # noqa: F401
+
+            PLAYWRIGHT_AVAILABLE = True
+        except ImportError:
+            PLAYWRIGHT_AVAILABLE = False
+    return PLAYWRIGHT_AVAILABLE
+
+
+@lru_cache(maxsize=512)
+def _company_slug(company: str) -> str:
+    """Lowercase, underscore-joined company name for filenames."""
+    return company.lower().translate(_COMPANY_SLUG)
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write *data* to *path* as indented JSON."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+@lru_cache(maxsize=32)
+def _load_profile_cached(path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    """Parse the master profile once per (path, mtime, size).
+
+    The stat fields only participate in the cache key so edits to the
+    profile invalidate the entry, even on filesystems with coarse mtimes.
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data if isinstance(data, dict) else {}
 
 
 def load_profile() -> dict[str, Any]:
-    """Load user profile for form filling."""
+    """
+    Load user profile for form filling.
+
+    The parsed profile is cached per process and invalidated when the file
+    changes; the returned dict is shared and must not be mutated.
+    """
     profile_path = CONFIG_DIR / "master_profile.yaml"
-    if profile_path.exists():
-        import yaml
+    try:
+        st = profile_path.stat()
+    except FileNotFoundError:
+        return {}
+    return _load_profile_cached(str(profile_path), st.st_mtime_ns, st.st_size)
 
-        with open(profile_path) as f:
-            data = yaml.safe_load(f)
-        if isinstance(data, dict):
-            return data
-    return {}
+
+@lru_cache(maxsize=1)
+def _resolver_cached(path: str, _mtime_ns: int) -> AnswerResolver:
+    """Build the answer resolver once per profile (path, mtime)."""
+    return AnswerResolver.from_profile(Path(path))
+
+
+def _get_resolver() -> AnswerResolver:
+    """
+    Shared AnswerResolver for form filling.
+
+    Rebuilt only when master_profile.yaml changes, so a batch parses the
+    answers once instead of once per form.
+    """
+    path = ANSWERS_CONFIG_DIR / "master_profile.yaml"
+    mtime_ns = path.stat().st_mtime_ns if path.exists() else -1
+    return _resolver_cached(str(path), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _scan_pdfs(directory: str, _mtime_ns: int) -> tuple[tuple[str, ...], str | None]:
+    """List the PDFs in *directory* once per directory mtime.
+
+    Returns ``(names, latest)`` where *names* are in scandir order and
+    *latest* is the most recently modified one. *_mtime_ns* only
+    participates in the cache key: adding, removing or renaming a variant
+    bumps it and forces a rescan.
+    """
+    names: list[str] = []
+    latest: str | None = None
+    latest_mtime = -1.0
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".pdf") and entry.is_file():
+                names.append(entry.name)
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.name, mtime
+    return tuple(names), latest
+
+
+def _pdf_index(directory: Path) -> tuple[tuple[str, ...], str | None]:
+    """Cached ``(names, latest)`` PDF listing for *directory* (empty if missing)."""
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return (), None
+    return _scan_pdfs(str(directory), mtime_ns)
+
+
+def _latest_pdf(directory: Path) -> Path | None:
+    """Most recently modified PDF in *directory*."""
+    latest = _pdf_index(directory)[1]
+    return directory / latest if latest else None
+
+
+@lru_cache(maxsize=1)
+def _scan_analyzed(directory: str, _mtime_ns: int) -> tuple[dict[str, str], tuple[str, ...]]:
+    """List the analysis files in *directory* once per directory mtime.
+
+    Returns ``(by_id, names)``: *by_id* maps the job_id parsed from
+    ``{company}_{job_id}_{YYYYMMDD}.json`` to its filename and *names* keeps
+    every analysis filename in scandir order for substring lookups.
+    """
+    by_id: dict[str, str] = {}
+    names: list[str] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".json") and name != ANALYZED_INDEX_NAME and entry.is_file():
+                names.append(name)
+                parts = name[:-5].rsplit("_", 2)
+                if len(parts) == 3:
+                    by_id.setdefault(parts[1], name)
+    return by_id, tuple(names)
+
+
+@lru_cache(maxsize=1)
+def _analyzed_index_cached(path: str, _mtime_ns: int) -> dict[str, str]:
+    """Parse the analyzed-jobs index once per (path, mtime)."""
+    data = _read_json(Path(path))
+    return data if isinstance(data, dict) else {}
+
+
+def _find_analyzed_job(job_id: str) -> Path | None:
+    """
+    Locate the analysis file for *job_id*.
+
+    Uses the job_id -> filename index written by JobAnalyzer.save_analysis
+    when it has an entry. Otherwise falls back to a directory listing cached
+    per directory mtime: first the job_id parsed from each filename, then
+    any filename containing *job_id*.
+    """
+    index_path = ANALYZED_DIR / ANALYZED_INDEX_NAME
+    try:
+        index = _analyzed_index_cached(str(index_path), index_path.stat().st_mtime_ns)
+    except (OSError, ValueError):
+        index = {}
+
+    filename = index.get(job_id)
+    if filename and (ANALYZED_DIR / filename).is_file():
+        return ANALYZED_DIR / filename
+
+    try:
+        by_id, names = _scan_analyzed(str(ANALYZED_DIR), ANALYZED_DIR.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    filename = by_id.get(job_id) or next((name for name in names if job_id in name), None)
+    return ANALYZED_DIR / filename if filename else None
 
 
 def get_resume_variant(job_id: str) -> Path | None:
     """Get the resume variant for a specific job."""
     variants_dir = RESUME_DIR / "variants"
 
-    # Look for matching variant
-    for variant in variants_dir.glob(f"*{job_id}*.pdf"):
-        return variant
+    # Look for matching variant in the cached directory listing
+    names, _ = _pdf_index(variants_dir)
+    variant = next((name for name in names if job_id in name), None)
+    if variant:
+        return variants_dir / variant
 
-    # Fall back to latest approved variant
-    approved_dir = RESUME_DIR / "variants" / "approved"
-    if approved_dir.exists():
-        variants = list(approved_dir.glob("*.pdf"))
-        if variants:
-            return max(variants, key=lambda p: p.stat().st_mtime)
+    # Fall back to latest approved variant, then to the latest base export
+    return _latest_pdf(variants_dir / "approved") or _latest_pdf(RESUME_DIR / "exports")
 
-    # Fall back to base export
-    exports_dir = RESUME_DIR / "exports"
-    if exports_dir.exists():
-        exports = list(exports_dir.glob("*.pdf"))
-        if exports:
-            return max(exports, key=lambda p: p.stat().st_mtime)
 
-    return None
-
-
-def validate_submission(job: dict, resume_path: Path) -> dict:
+def validate_submission(job: dict, resume_path: Path, tracker: Any = None) -> dict:
     """
     Validate submission requirements before applying.
 
+    Args:
+        job: Job dictionary
+        resume_path: Path to resume PDF
+        tracker: Optional ApplicationTracker to reuse; one is opened otherwise
+
+    The already-applied DB lookup only runs when the resume and score checks
+    pass.
+
     Returns dict with 'valid' boolean and 'errors' list.
     """
     errors = []
@@ -91,11 +275,16 @@ def validate_submission(job: dict, resume_path: Path) -> dict:
     if match_score < 70:
         errors.append(f"Match score too low: {match_score}% (minimum 70%)")
 
+    # Already invalid: skip the DB lookup
+    if errors:
+        return {"valid": False, "errors": errors}
+
     # Check not already applied (DB lookup)
     try:
-        from scripts.tracking import ApplicationTracker
+        if tracker is None:
+            from scripts.tracking import ApplicationTracker
 
-        tracker = ApplicationTracker()
+            tracker = ApplicationTracker()
         company = job.get("company", "")
         role = job.get("title") or job.get("role", "")
         job_url = job.get("job_url") or job.get("url")
@@ -113,8 +302,38 @@ def validate_submission(job: dict, resume_path: Path) -> dict:
     return {"valid": len(errors) == 0, "errors": errors}
 
 
+def validate_submissions(
+    submissions: Iterable[tuple[dict, Path]], max_workers: int = 4
+) -> list[dict]:
+    """
+    Validate many (job, resume_path) pairs, overlapping their DB lookups.
+
+    One ApplicationTracker is shared by all checks. Each lookup opens its own
+    SQLite connection, and sqlite3 releases the GIL while a query runs, so
+    the already-applied checks run concurrently on a small thread pool.
+
+    Returns one validation dict per pair, in input order.
+    """
+    try:
+        from scripts.tracking import ApplicationTracker
+
+        tracker = ApplicationTracker()
+    except Exception:
+        tracker = None  # validate_submission falls back per job
+
+    pairs = list(submissions)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as pool:
+        return list(
+            pool.map(lambda pair: validate_submission(pair[0], pair[1], tracker=tracker), pairs)
+        )
+
+
 def submit_application(
-    job: dict, resume_path: Path, cover_letter_path: Path | None = None, confirm: bool = True
+    job: dict,
+    resume_path: Path,
+    cover_letter_path: Path | None = None,
+    confirm: bool = True,
+    session: PlaywrightSession | None = None,
 ) -> dict:
     """
     Submit job application using Playwright automation.
@@ -127,6 +346,7 @@ def submit_application(
         resume_path: Path to resume PDF
         cover_letter_path: Optional cover letter path
         confirm: Whether to require confirmation before submit
+        session: Optional shared browser session (see PlaywrightSession)
 
     Returns:
         Submission result dictionary
@@ -164,9 +384,9 @@ def submit_application(
         }
 
     # Try Playwright automation if available
-    if PLAYWRIGHT_AVAILABLE:
+    if _ensure_playwright():
         try:
-            result = execute_playwright_submission(submission_data)
+            result = execute_playwright_submission(submission_data, session=session)
             return result
         except Exception as e:
             return {
@@ -190,7 +410,7 @@ def submit_application(
                 },
                 {"tool": "browser_file_upload", "params": {"paths": [str(resume_path)]}},
                 {"tool": "browser_click", "params": {"element": "Submit button"}},
-                {"tool": "browser_take_screenshot", "params": {"type": "png"}},
+                {"tool": "browser_take_screenshot", "params": {"type": "jpeg"}},
             ]
         },
         "submission_data": submission_data,
@@ -219,157 +439,433 @@ def _extract_form_data(personal: dict) -> dict[str, str]:
     }
 
 
+# MCP fill_form role and label patterns per profile field
+_FIELD_MAPPING: dict[str, tuple[str, tuple[str, ...]]] = {
+    "name": ("textbox", ("name", "full name", "your name")),
+    "email": ("textbox", ("email", "e-mail")),
+    "phone": ("textbox", ("phone", "mobile", "telephone")),
+    "linkedin": ("textbox", ("linkedin", "profile url")),
+    "website": ("textbox", ("website", "portfolio")),
+    "location": ("textbox", ("location", "city", "address")),
+}
+
+
 def _map_form_fields(form_data: dict) -> list[dict[str, Any]]:
     """Map form data to Playwright MCP fill_form format."""
-    field_mapping = {
-        "name": {"type": "textbox", "patterns": ["name", "full name", "your name"]},
-        "email": {"type": "textbox", "patterns": ["email", "e-mail"]},
-        "phone": {"type": "textbox", "patterns": ["phone", "mobile", "telephone"]},
-        "linkedin": {"type": "textbox", "patterns": ["linkedin", "profile url"]},
-        "website": {"type": "textbox", "patterns": ["website", "portfolio"]},
-        "location": {"type": "textbox", "patterns": ["location", "city", "address"]},
-    }
+    return [
+        {"name": key, "type": field_type, "value": value, "patterns": list(patterns)}
+        for key, value in form_data.items()
+        if value and key in _FIELD_MAPPING
+        for field_type, patterns in (_FIELD_MAPPING[key],)
+    ]
 
-    fields = []
-    for key, value in form_data.items():
-        if value and key in field_mapping:
-            fields.append(
-                {
-                    "name": key,
-                    "type": field_mapping[key]["type"],
-                    "value": value,
-                    "patterns": field_mapping[key]["patterns"],
-                }
-            )
-    return fields
+
+# Subresources form filling never needs. Stylesheets stay so review
+# screenshots look like the real page.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "segment.io", "hotjar")
 
 
-def execute_playwright_submission(submission_data: dict) -> dict:
+def _route_request(route: Route) -> None:
+    """Abort heavy or tracking requests; let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host in request.url for host in _BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+class PlaywrightSession:
+    """
+    One Playwright driver, Chromium instance and browser context shared by
+    several submissions.
+
+    Launching Chromium costs a second or two, so batch runs open one session
+    and give each submission its own page. The browser is started lazily on
+    the first submission, so a session whose jobs all fail validation never
+    launches it. Pages are left open for human review until the session
+    closes. Images, fonts, media and analytics requests are blocked unless
+    *block_resources* is False (e.g. when a form relies on an image CAPTCHA).
+
+    Usage:
+        with PlaywrightSession() as session:
+            results = session.submit_many(submissions)
+    """
+
+    def __init__(self, headless: bool = False, block_resources: bool = True) -> None:
+        self.headless = headless  # Visible by default for human oversight
+        self.block_resources = block_resources
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._context: Any = None
+
+    def __enter__(self) -> PlaywrightSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _ensure_context(self) -> Any:
+        """Start Playwright and launch the browser on first use."""
+        if self._context is None:
+            if not _ensure_playwright():
+                raise RuntimeError(
+                    "Playwright not installed. "
+                    "Run: pip install playwright && playwright install chromium"
+                )
+            from playwright.sync_api import sync_playwright
+
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+            self._context = self._browser.new_context()
+            if self.block_resources:
+                self._context.route("**/*", _route_request)
+        return self._context
+
+    def submit(self, submission_data: dict) -> dict:
+        """Fill one application in a new page of the shared context."""
+        page = self._ensure_context().new_page()
+        return _submit_on_page(page, submission_data)
+
+    def submit_many(self, submissions: Iterable[dict]) -> list[dict]:
+        """Fill several applications, one page each, reusing the browser."""
+        return [self.submit(submission_data) for submission_data in submissions]
+
+    def close(self) -> None:
+        """Close the browser and stop the Playwright driver, if started."""
+        if self._browser is not None:
+            self._browser.close()
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._playwright = self._browser = self._context = None
+
+
+def execute_playwright_submission(
+    submission_data: dict, session: PlaywrightSession | None = None
+) -> dict:
     """
     Execute job application using Playwright Python library.
 
     Args:
         submission_data: Dict with url, form_data, resume_path
+        session: Optional shared session; the process-wide default session
+            is used otherwise
 
     Returns:
         Submission result with status and screenshot path
     """
-    if not PLAYWRIGHT_AVAILABLE:
+    if not _ensure_playwright():
         raise RuntimeError(
             "Playwright not installed. Run: pip install playwright && playwright install chromium"
         )
 
+    return (session or _default_session()).submit(submission_data)
+
+
+_DEFAULT_SESSION: PlaywrightSession | None = None
+
+
+def _default_session() -> PlaywrightSession:
+    """
+    Process-wide session for submissions made without an explicit one.
+
+    Repeated apply_to_job calls then launch Chromium once instead of once
+    per job; the browser closes at interpreter exit. Playwright's sync API
+    is bound to the thread that started it, so concurrent callers should
+    pass their own PlaywrightSession.
+    """
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        _DEFAULT_SESSION = PlaywrightSession()
+        atexit.register(_DEFAULT_SESSION.close)
+    return _DEFAULT_SESSION
+
+
+def warm_browser() -> None:
+    """
+    Launch the default session's browser ahead of the first submission.
+
+    Call during idle time (e.g. while the user reviews a batch) so the first
+    apply_to_job(confirm=True) does not pay Chromium's cold start.
+    """
+    _default_session()._ensure_context()
+
+
+# Review screenshots only need to be legible: JPEG encodes faster and is
+# several times smaller than Chromium's default PNG
+_SCREENSHOT_OPTIONS: dict[str, Any] = {"type": "jpeg", "quality": 60}
+
+# Screenshot files are written off the page thread so the next job's
+# navigation overlaps the disk write; drain_pending_io() waits for them
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-io")
+_PENDING_IO: list[Future[int]] = []
+_PENDING_IO_LOCK = Lock()
+
+
+def _write_in_background(path: Path, data: bytes) -> None:
+    """Queue *data* to be written to *path* on the I/O pool."""
+    future = _IO_POOL.submit(path.write_bytes, data)
+    with _PENDING_IO_LOCK:
+        # Forget writes that already succeeded so a long-running process
+        # doesn't accumulate futures; failed ones stay for drain to raise
+        _PENDING_IO[:] = [f for f in _PENDING_IO if not f.done() or f.exception() is not None]
+        _PENDING_IO.append(future)
+
+
+def drain_pending_io() -> None:
+    """
+    Wait for every queued screenshot write.
+
+    All writes are waited for before the first failure, if any, is raised.
+    """
+    with _PENDING_IO_LOCK:
+        pending = _PENDING_IO[:]
+        _PENDING_IO.clear()
+    errors = [e for e in (f.exception() for f in pending) if e is not None]
+    if errors:
+        raise errors[0]
+
+
+# Any visible form control means the application form has rendered
+_FORM_READY_SELECTOR = "form input, form textarea, form select"
+
+
+def _submit_on_page(page: Page, submission_data: dict) -> dict:
+    """Navigate, fill and screenshot one application on an open page."""
     SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    company = submission_data.get("company", "unknown").replace(" ", "_").lower()
-    screenshot_path = SCREENSHOTS_DIR / f"{company}_{timestamp}.png"
+    # Name the screenshot after the submission's own timestamp
+    submitted = submission_data.get("timestamp")
+    when = datetime.fromisoformat(submitted) if submitted else datetime.now()
+    timestamp = when.strftime("%Y%m%d_%H%M%S")
+    company = _company_slug(submission_data.get("company", "unknown"))
+    screenshot_path = SCREENSHOTS_DIR / f"{company}_{timestamp}.jpg"
 
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=False)  # Visible for human oversight
-        context = browser.new_context()
-        page = context.new_page()
+    try:
+        # Navigate to application page
+        # Wait for form controls rather than network silence: analytics
+        # beacons can keep career sites from ever going idle. A page with no
+        # form yet (e.g. a login wall) still gets a best-effort fill.
+        page.goto(submission_data["url"], timeout=30000, wait_until="domcontentloaded")
+        with suppress(Exception):
+            page.locator(_FORM_READY_SELECTOR).first.wait_for(state="visible", timeout=10_000)
 
-        try:
-            # Navigate to application page
-            page.goto(submission_data["url"], timeout=30000)
-            page.wait_for_load_state("networkidle")
+        # Try to fill form fields
+        form_data = submission_data.get("form_data", {})
+        filled_fields = _fill_application_form(page, form_data)
 
-            # Try to fill form fields
-            form_data = submission_data.get("form_data", {})
-            filled_fields = _fill_application_form(page, form_data)
+        # Upload resume
+        resume_path = submission_data.get("resume_path")
+        uploaded = _upload_resume(page, resume_path) if resume_path else False
 
-            # Upload resume
-            resume_path = submission_data.get("resume_path")
-            uploaded = _upload_resume(page, resume_path) if resume_path else False
+        # Take screenshot before submission
+        _write_in_background(screenshot_path, page.screenshot(**_SCREENSHOT_OPTIONS))
 
-            # Take screenshot before submission
-            page.screenshot(path=str(screenshot_path))
+        # Look for submit button but DON'T click - human review required
+        submit_button = _find_submit_button(page)
 
-            # Look for submit button but DON'T click - human review required
-            submit_button = _find_submit_button(page)
+        return {
+            "status": "ready_for_review",
+            "message": "Form filled. Review and click submit manually.",
+            "screenshot": str(screenshot_path),
+            "filled_fields": filled_fields,
+            "resume_uploaded": uploaded,
+            "submit_button_found": submit_button is not None,
+            "browser_open": True,  # Page stays open for human review
+        }
 
-            return {
-                "status": "ready_for_review",
-                "message": "Form filled. Review and click submit manually.",
-                "screenshot": str(screenshot_path),
-                "filled_fields": filled_fields,
-                "resume_uploaded": uploaded,
-                "submit_button_found": submit_button is not None,
-                "browser_open": True,  # Browser stays open for human review
+    except Exception as e:
+        page.screenshot(path=str(screenshot_path), **_SCREENSHOT_OPTIONS)
+        page.close()
+        raise e
+
+
+# Common field selectors, tried in order per field
+_FIELD_SELECTORS: dict[str, tuple[str, ...]] = {
+    "name": ('input[name*="name" i]', 'input[placeholder*="name" i]', "#name", "#fullName"),
+    "email": ('input[type="email"]', 'input[name*="email" i]', "#email"),
+    "phone": (
+        'input[type="tel"]',
+        'input[name*="phone" i]',
+        'input[name*="mobile" i]',
+        "#phone",
+    ),
+    "linkedin": ('input[name*="linkedin" i]', 'input[placeholder*="linkedin" i]'),
+    "website": ('input[name*="website" i]', 'input[name*="portfolio" i]'),
+    "location": (
+        'input[name*="location" i]',
+        'input[name*="city" i]',
+        'input[name*="address" i]',
+    ),
+}
+
+# Accessible-name patterns per field (JavaScript RegExp source, matched
+# case-insensitively against label text and aria-label). Anchored where
+# a bare word would also hit "Company name".
+_FIELD_LABELS: dict[str, str] = {
+    "name": r"^\s*(full\s+|your\s+)?name\b",
+    "email": r"^\s*(your\s+)?e-?mail\b",
+    "phone": r"\b(phone|mobile|telephone)\b",
+    "linkedin": r"\blinked\s*in\b",
+    "website": r"\b(website|portfolio)\b",
+    "location": r"\b(location|city|address)\b",
+}
+
+# Fills every known field in one page round-trip. Each field is first
+# matched by its accessible name (a <label> or aria-label on a visible,
+# non-hidden text input); when no label matches, the first selector whose
+# match is a visible text input or textarea wins. The element's native
+# value setter plus input/change events keep framework-controlled inputs
+# (React, Vue) in sync. A field that fails to fill is skipped without
+# affecting the rest. Returns the filled field names.
+_FILL_FIELDS_JS = """
+([labels, selectors, values]) => {
+    const setInputValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    const setTextAreaValue = Object.getOwnPropertyDescriptor(
+        HTMLTextAreaElement.prototype, "value").set;
+    const skipTypes = new Set(["checkbox", "radio", "file", "hidden", "submit", "button"]);
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== "hidden"
+            && !el.closest('[aria-hidden="true"]');
+    };
+    const isTextInput = (el) => el instanceof HTMLInputElement && !skipTypes.has(el.type);
+    const isFillable = (el) => isTextInput(el) || el instanceof HTMLTextAreaElement;
+    // One walk collects every accessible name -> control pair
+    const named = [];
+    for (const label of document.querySelectorAll("label")) {
+        const el = label.htmlFor
+            ? document.getElementById(label.htmlFor)
+            : label.querySelector("input");
+        if (el) named.push([label.innerText, el]);
+    }
+    for (const el of document.querySelectorAll("input[aria-label]")) {
+        named.push([el.getAttribute("aria-label"), el]);
+    }
+    const used = new Set();
+    const byLabel = (field) => {
+        if (!labels[field]) return null;
+        const pattern = new RegExp(labels[field], "i");
+        for (const [text, el] of named) {
+            if (!used.has(el) && pattern.test(text) && isTextInput(el) && isVisible(el)) {
+                return el;
             }
-
-        except Exception as e:
-            page.screenshot(path=str(screenshot_path))
-            browser.close()
-            raise e
+        }
+        return null;
+    };
+    const bySelector = (field) => {
+        for (const selector of selectors[field] || []) {
+            let el;
+            try {
+                el = document.querySelector(selector);
+            } catch (e) {
+                continue;
+            }
+            if (el && !used.has(el) && isFillable(el) && isVisible(el)) return el;
+        }
+        return null;
+    };
+    const filled = [];
+    for (const [field, value] of Object.entries(values)) {
+        const el = byLabel(field) || bySelector(field);
+        if (!el) continue;
+        try {
+            el.focus();
+            const setValue = el instanceof HTMLTextAreaElement ? setTextAreaValue : setInputValue;
+            setValue.call(el, value);
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+        } catch (e) {
+            continue;
+        }
+        used.add(el);
+        filled.push(field);
+    }
+    return filled;
+}
+"""
 
 
 def _fill_application_form(page: Page, form_data: dict) -> list[str]:
     """Fill form fields on the page."""
-    filled = []
-
-    # Common field selectors
-    field_selectors = {
-        "name": ['input[name*="name" i]', 'input[placeholder*="name" i]', "#name", "#fullName"],
-        "email": ['input[type="email"]', 'input[name*="email" i]', "#email"],
-        "phone": [
-            'input[type="tel"]',
-            'input[name*="phone" i]',
-            'input[name*="mobile" i]',
-            "#phone",
-        ],
-        "linkedin": ['input[name*="linkedin" i]', 'input[placeholder*="linkedin" i]'],
-        "website": ['input[name*="website" i]', 'input[name*="portfolio" i]'],
-        "location": [
-            'input[name*="location" i]',
-            'input[name*="city" i]',
-            'input[name*="address" i]',
-        ],
-    }
-
-    for field_name, value in form_data.items():
-        if not value or field_name not in field_selectors:
-            continue
+    values = {k: v for k, v in form_data.items() if v and k in _FIELD_SELECTORS}
+    # Playwright serializes lists, not tuples, into page arguments
+    selectors = {k: list(_FIELD_SELECTORS[k]) for k in values}
+    try:
+        filled: list[str] = page.evaluate(_FILL_FIELDS_JS, [_FIELD_LABELS, selectors, values])
+    except Exception:
+        filled = []
 
-        for selector in field_selectors[field_name]:
+    # Second pass: use AnswerResolver for remaining unfilled fields
+    resolver = _get_resolver()
+    for label_text, element_info in _extract_unfilled_labels(page, filled):
+        resolved = resolver.resolve(
+            question=label_text,
+            field_type=element_info.get("type", "text"),
+            options=element_info.get("options"),
+        )
+        if resolved and resolved.confidence >= 0.7:
+            # The label scan only reports visible controls, so skip a separate
+            # is_visible() round-trip and let the actions' own short wait
+            # catch controls that disappeared since
+            el = element_info["element"]
             try:
-                element = page.locator(selector).first
-                if element.is_visible():
-                    element.fill(value)
-                    filled.append(field_name)
-                    break
+                if resolved.field_type in ("dropdown", "select"):
+                    el.select_option(label=resolved.answer, timeout=1000)
+                else:
+                    el.fill(resolved.answer, timeout=1000)
             except Exception:
                 continue
+            filled.append(f"auto:{label_text[:30]}")
 
-    # Second pass: use AnswerResolver for remaining unfilled fields
-    try:
-        from scripts.submission.easy_apply_answers import AnswerResolver
-
-        resolver = AnswerResolver.from_profile()
-        unfilled = _extract_unfilled_labels(page, filled)
+    return filled
 
-        for label_text, element_info in unfilled:
-            resolved = resolver.resolve(
-                question=label_text,
-                field_type=element_info.get("type", "text"),
-                options=element_info.get("options"),
-            )
-            if resolved and resolved.confidence >= 0.7:
-                try:
-                    el = element_info.get("element")
-                    if el and el.is_visible():
-                        if resolved.field_type in ("dropdown", "select"):
-                            el.select_option(label=resolved.answer)
-                        else:
-                            el.fill(resolved.answer)
-                        filled.append(f"auto:{label_text[:30]}")
-                except Exception:
-                    continue
-    except ImportError:
-        pass  # AnswerResolver not available
 
-    return filled
+# Collects every label with a visible associated control in one page
+# round-trip. Each control is tagged with a data-cp-field index so Python
+# can re-acquire it with a plain attribute selector only when it decides
+# to fill it. Returns [{text, index, tag, type, options}].
+_LABEL_FIELDS_JS = """
+() => {
+    document.querySelectorAll("[data-cp-field]").forEach(
+        (el) => el.removeAttribute("data-cp-field")
+    );
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0
+            && getComputedStyle(el).visibility !== "hidden";
+    };
+    const marks = new Map();
+    const fields = [];
+    for (const label of document.querySelectorAll("label")) {
+        const text = label.innerText.trim();
+        if (!text || text.length > 200) continue;
+        const el = label.htmlFor
+            ? document.getElementById(label.htmlFor)
+            : label.querySelector("input, select, textarea");
+        if (!el || !isVisible(el)) continue;
+        let index = marks.get(el);
+        if (index === undefined) {
+            index = marks.size;
+            marks.set(el, index);
+            el.setAttribute("data-cp-field", String(index));
+        }
+        const tag = el.tagName.toLowerCase();
+        fields.push({
+            text,
+            index,
+            tag,
+            type: el.getAttribute("type") || "text",
+            options: tag === "select"
+                ? Array.from(el.options, (o) => (o.innerText || o.text).trim()).filter(Boolean)
+                : null,
+        });
+    }
+    return fields;
+}
+"""
 
 
 def _extract_unfilled_labels(
@@ -383,93 +879,69 @@ def _extract_unfilled_labels(
     results = []
 
     try:
-        # Find all label elements
-        labels = page.locator("label").all()
-        for label in labels:
-            try:
-                label_text = label.inner_text().strip()
-                if not label_text or len(label_text) > 200:
-                    continue
-
-                # Skip if this field was already filled
-                if any(f.lower() in label_text.lower() for f in already_filled):
-                    continue
-
-                # Find associated input
-                for_attr = label.get_attribute("for")
-                if for_attr:
-                    input_el = page.locator(f"#{for_attr}").first
-                else:
-                    input_el = label.locator("input, select, textarea").first
-
-                if not input_el or not input_el.is_visible():
-                    continue
+        fields = page.evaluate(_LABEL_FIELDS_JS)
+    except Exception:
+        return results  # Best-effort extraction
 
-                tag = input_el.evaluate("el => el.tagName.toLowerCase()")
-                input_type = input_el.get_attribute("type") or "text"
+    filled_lower = [f.lower() for f in already_filled]
+    for field_info in fields:
+        label_text = field_info["text"]
 
-                element_info: dict[str, Any] = {"element": input_el, "type": input_type}
+        # Skip if this field was already filled
+        label_lower = label_text.lower()
+        if any(f in label_lower for f in filled_lower):
+            continue
 
-                if tag == "select":
-                    element_info["type"] = "dropdown"
-                    option_els = input_el.locator("option").all()
-                    element_info["options"] = [
-                        o.inner_text().strip() for o in option_els if o.inner_text().strip()
-                    ]
+        element_info: dict[str, Any] = {
+            # Locators are lazy: no round-trip until the caller fills it
+            "element": page.locator(f'[data-cp-field="{field_info["index"]}"]').first,
+            "type": field_info["type"],
+        }
+        if field_info["tag"] == "select":
+            element_info["type"] = "dropdown"
+            element_info["options"] = field_info["options"]
 
-                results.append((label_text, element_info))
-            except Exception:
-                continue
-    except Exception:
-        pass  # Best-effort extraction; return whatever was collected
+        results.append((label_text, element_info))
 
     return results
 
 
+# Only file inputs accept set_input_files, so accept/name variants could
+# never match anything this selector misses
+_FILE_INPUT_SELECTOR = 'input[type="file"]'
+
+
 def _upload_resume(page: Page, resume_path: str) -> bool:
-    """Upload resume file."""
+    """Upload resume file to the first file input on the page."""
     try:
-        # Common file input selectors
-        file_selectors = [
-            'input[type="file"]',
-            'input[accept*="pdf"]',
-            'input[name*="resume" i]',
-            'input[name*="cv" i]',
-        ]
-
-        for selector in file_selectors:
-            try:
-                file_input = page.locator(selector).first
-                if file_input:
-                    file_input.set_input_files(resume_path)
-                    return True
-            except Exception:
-                continue
-
-        return False
+        page.locator(_FILE_INPUT_SELECTOR).first.set_input_files(resume_path, timeout=2000)
+        return True
     except Exception:
         return False
 
 
-def _find_submit_button(page: Page) -> Locator | None:
-    """Find the submit button on the page."""
-    submit_selectors = [
+# Submit buttons as one selector list; Playwright's CSS engine supports
+# :has-text() inside comma lists, so the page is searched once
+_SUBMIT_BUTTON_SELECTOR = ", ".join(
+    (
         'button[type="submit"]',
         'input[type="submit"]',
         'button:has-text("Submit")',
         'button:has-text("Apply")',
         'button:has-text("Send")',
         'a:has-text("Submit Application")',
-    ]
+    )
+)
 
-    for selector in submit_selectors:
-        try:
-            button = page.locator(selector).first
-            if button.is_visible():
-                return button
-        except Exception:
-            continue
 
+def _find_submit_button(page: Page) -> Locator | None:
+    """Find the first visible submit button on the page (in document order)."""
+    try:
+        button = page.locator(f"{_SUBMIT_BUTTON_SELECTOR} >> visible=true").first
+        if button.is_visible():
+            return button
+    except Exception:
+        pass
     return None
 
 
@@ -479,47 +951,65 @@ def record_application(job: dict, result: dict) -> Path:
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     job_id = job.get("id", "unknown")
-    company = job.get("company", "unknown").replace(" ", "_").lower()
+    company = _company_slug(job.get("company", "unknown"))
 
     filename = f"{company}_{job_id}_{timestamp}.json"
     filepath = APPLIED_DIR / filename
 
     record = {"job": job, "result": result, "timestamp": timestamp, "status": result.get("status")}
 
-    with open(filepath, "w") as f:
-        json.dump(record, f, indent=2)
+    _write_json(filepath, record)
 
     return filepath
 
 
-def apply_to_job(job_id: str, confirm: bool = False) -> dict:
+def apply_to_job(
+    job_id: str, confirm: bool = False, session: PlaywrightSession | None = None
+) -> dict:
     """
     Main entry point for job application.
 
     Args:
         job_id: ID of the job to apply to
         confirm: Whether to proceed without additional confirmation
+        session: Optional shared browser session (see PlaywrightSession)
 
     Returns:
-        Application result
+        Application result. Without a *session* its screenshot is on disk
+        on return; callers batching jobs through their own session call
+        drain_pending_io() once before reading screenshots.
     """
-    # Load job from analyzed
-    analyzed_dir = Path("jobs/analyzed")
-    job_files = list(analyzed_dir.glob(f"*{job_id}*.json"))
+    job, resume_path = _load_job(job_id)
+    result = _apply_loaded(job_id, job, resume_path, confirm, session)
+    if session is None:
+        # Nothing to overlap the write with on this single-job path
+        drain_pending_io()
+    return result
 
-    if not job_files:
-        return {"status": "error", "message": f"Job {job_id} not found"}
 
-    with open(job_files[0]) as f:
-        job = json.load(f)
+def _load_job(job_id: str) -> tuple[dict | None, Path | None]:
+    """Read the analyzed job and find its resume (``(None, None)`` if no job)."""
+    job_file = _find_analyzed_job(job_id)
+    if not job_file:
+        return None, None
+    return _read_json(job_file), get_resume_variant(job_id)
 
-    # Get resume
-    resume_path = get_resume_variant(job_id)
+
+def _apply_loaded(
+    job_id: str,
+    job: dict | None,
+    resume_path: Path | None,
+    confirm: bool,
+    session: PlaywrightSession | None,
+) -> dict:
+    """Submit and record a job whose data _load_job already read."""
+    if job is None:
+        return {"status": "error", "message": f"Job {job_id} not found"}
     if not resume_path:
         return {"status": "error", "message": "No resume variant found"}
 
     # Submit
-    result = submit_application(job, resume_path, confirm=confirm)
+    result = submit_application(job, resume_path, confirm=confirm, session=session)
 
     # Record any successful submission attempt
     if result.get("status") in ("submitted", "ready_for_review", "ready_to_submit"):
@@ -529,6 +1019,64 @@ def apply_to_job(job_id: str, confirm: bool = False) -> dict:
     return result
 
 
+def _apply_batch(job_ids: list[str], confirm: bool) -> list[dict]:
+    """
+    Apply to *job_ids* in order inside one browser session.
+
+    The next job's JSON and resume lookup are read on a helper thread while
+    the current job is in the browser.
+    """
+    if not job_ids:
+        return []
+    results: list[dict] = []
+    with PlaywrightSession() as session, ThreadPoolExecutor(max_workers=1) as prefetch:
+        upcoming = prefetch.submit(_load_job, job_ids[0])
+        for i, job_id in enumerate(job_ids):
+            job, resume_path = upcoming.result()
+            if i + 1 < len(job_ids):
+                upcoming = prefetch.submit(_load_job, job_ids[i + 1])
+            results.append(_apply_loaded(job_id, job, resume_path, confirm, session))
+    return results
+
+
+def apply_to_jobs(
+    job_ids: Iterable[str], confirm: bool = False, concurrency: int = 1
+) -> list[dict]:
+    """
+    Apply to several jobs, sharing one browser per worker.
+
+    With ``concurrency > 1`` the jobs are dealt round-robin to that many
+    worker threads. Each worker drives its own PlaywrightSession, since a
+    sync Playwright instance is bound to the thread that started it. Page
+    loads are network-bound, so the workers overlap their waits.
+
+    Args:
+        job_ids: IDs of the jobs to apply to
+        confirm: Whether to proceed without additional confirmation
+        concurrency: Number of browsers to drive in parallel
+
+    Returns:
+        One application result per job, in input order
+    """
+    job_ids = list(job_ids)
+    if concurrency <= 1 or len(job_ids) <= 1:
+        results = _apply_batch(job_ids, confirm)
+    else:
+        workers = min(concurrency, len(job_ids))
+        shards = [job_ids[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            shard_results = list(pool.map(_apply_batch, shards, [confirm] * workers))
+
+        # Undo the round-robin deal so results line up with job_ids
+        results = [{}] * len(job_ids)
+        for i, shard_result in enumerate(shard_results):
+            results[i::workers] = shard_result
+
+    # Screenshots referenced by the results must exist when we return
+    drain_pending_io()
+    return results
+
+
 if __name__ == "__main__":
     import sys
 
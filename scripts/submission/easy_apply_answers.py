@@ -10,12 +10,25 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
+# Optional Aho-Corasick automaton for scanning many custom questions at once
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# libyaml-backed loader when PyYAML was built with it (same safe subset)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Standard question patterns mapped to answer keys in application_answers
 QUESTION_PATTERNS: dict[str, list[str]] = {
     "work_authorization": [
@@ -59,6 +72,52 @@ QUESTION_PATTERNS: dict[str, list[str]] = {
     ],
 }
 
+# Equivalent spellings used to map yes/no answers onto dropdown options
+_BOOLEAN_ANSWERS = (frozenset({"yes", "true", "1"}), frozenset({"no", "false", "0"}))
+
+# One alternation per category, compiled at import: a single search decides
+# whether any of the category's patterns matches
+_CATEGORY_PATTERNS: dict[str, re.Pattern[str]] = {
+    key: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    for key, patterns in QUESTION_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _load_profile_cached(path: str, _mtime_ns: int, _size: int) -> dict[str, Any]:
+    """Parse a profile once per (path, mtime, size).
+
+    The stat fields only participate in the cache key so edits invalidate
+    the entry. The returned dict is shared and must not be mutated.
+    """
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data if isinstance(data, dict) else {}
+
+
+@dataclass(frozen=True)
+class _CustomIndex:
+    """Lowercased custom questions, built from one snapshot of custom_answers."""
+
+    source: dict[str, str]
+    pairs: tuple[tuple[str, str], ...]
+    # A question inside any custom question is also inside their join
+    blob: str
+    automaton: Any = None
+
+    @classmethod
+    def build(cls, custom_answers: dict[str, str]) -> _CustomIndex:
+        source = dict(custom_answers)
+        pairs = tuple((q.lower(), a) for q, a in source.items())
+        automaton = None
+        if AHOCORASICK_AVAILABLE and pairs:
+            automaton = ahocorasick.Automaton()
+            for i, (custom_q, _) in enumerate(pairs):
+                if custom_q not in automaton:  # Keep the first of duplicate keys
+                    automaton.add_word(custom_q, i)
+            automaton.make_automaton()
+        return cls(source, pairs, "\0".join(q for q, _ in pairs), automaton)
+
 
 @dataclass
 class ResolvedAnswer:
@@ -82,22 +141,28 @@ class AnswerResolver:
 
     answers: dict[str, str] = field(default_factory=dict)
     custom_answers: dict[str, str] = field(default_factory=dict)
+    _custom_index: _CustomIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._custom_index = _CustomIndex.build(self.custom_answers)
 
     @classmethod
     def from_profile(cls, profile_path: Path | None = None) -> AnswerResolver:
         """Load answer resolver from master_profile.yaml."""
         path = profile_path or CONFIG_DIR / "master_profile.yaml"
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls()
+        profile = _load_profile_cached(str(path), st.st_mtime_ns, st.st_size)
 
-        with open(path) as f:
-            profile = yaml.safe_load(f) or {}
-
-        app_answers = profile.get("application_answers", {})
-        custom = app_answers.pop("custom_answers", {}) if isinstance(app_answers, dict) else {}
+        app_answers = profile.get("application_answers") or {}
+        if not isinstance(app_answers, dict):
+            return cls()
+        custom = app_answers.get("custom_answers") or {}
 
         return cls(
-            answers={k: str(v) for k, v in app_answers.items() if v},
+            answers={k: str(v) for k, v in app_answers.items() if v and k != "custom_answers"},
             custom_answers={k: str(v) for k, v in custom.items() if v},
         )
 
@@ -124,35 +189,32 @@ class AnswerResolver:
         question_lower = question.lower().strip()
 
         # 1. Check custom_answers first (exact/substring match)
-        for custom_q, custom_a in self.custom_answers.items():
-            if custom_q.lower() in question_lower or question_lower in custom_q.lower():
-                answer = self._fit_to_options(custom_a, options) if options else custom_a
+        custom_a = self._match_custom(question_lower)
+        if custom_a is not None:
+            answer = self._fit_to_options(custom_a, options) if options else custom_a
+            return ResolvedAnswer(
+                question=question,
+                answer=answer,
+                confidence=0.95,
+                source="custom_answers",
+                field_type=field_type,
+            )
+
+        # 2. Pattern match against known question types
+        for answer_key, pattern in _CATEGORY_PATTERNS.items():
+            if not pattern.search(question_lower):
+                continue
+            raw_answer = self.answers.get(answer_key)
+            if raw_answer:  # Matched but unconfigured categories fall through
+                answer = self._fit_to_options(raw_answer, options) if options else raw_answer
                 return ResolvedAnswer(
                     question=question,
                     answer=answer,
-                    confidence=0.95,
-                    source="custom_answers",
+                    confidence=0.85,
+                    source=f"application_answers.{answer_key}",
                     field_type=field_type,
                 )
 
-        # 2. Pattern match against known question types
-        for answer_key, patterns in QUESTION_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, question_lower):
-                    raw_answer = self.answers.get(answer_key)
-                    if raw_answer:
-                        answer = (
-                            self._fit_to_options(raw_answer, options) if options else raw_answer
-                        )
-                        return ResolvedAnswer(
-                            question=question,
-                            answer=answer,
-                            confidence=0.85,
-                            source=f"application_answers.{answer_key}",
-                            field_type=field_type,
-                        )
-                    break  # Pattern matched but no answer configured
-
         return None
 
     def resolve_all(self, questions: list[dict[str, str]]) -> list[ResolvedAnswer]:
@@ -178,6 +240,39 @@ class AnswerResolver:
                 results.append(resolved)
         return results
 
+    def _current_custom_index(self) -> _CustomIndex:
+        """The custom-question index, rebuilt if custom_answers was edited."""
+        # Resolvers are shared between submission threads: the index is an
+        # immutable snapshot published with a single assignment, so readers
+        # never see a half-built one (concurrent rebuilds are identical).
+        # Equal dicts holding the same objects compare by identity, so an
+        # unchanged mapping costs one C-level pass and no allocations
+        index = self._custom_index
+        if index.source != self.custom_answers:
+            index = _CustomIndex.build(self.custom_answers)
+            self._custom_index = index
+        return index
+
+    def _match_custom(self, question_lower: str) -> str | None:
+        """
+        First custom answer, in profile order, whose question contains or is
+        contained in *question_lower*.
+        """
+        index = self._current_custom_index()
+        reverse = question_lower in index.blob
+        hits: set[int] | None = None
+        if index.automaton is not None:
+            # One linear pass finds every custom question inside the question
+            hits = {i for _, i in index.automaton.iter(question_lower)}
+            if not hits and not reverse:
+                return None
+
+        for i, (custom_q, custom_a) in enumerate(index.pairs):
+            contained = i in hits if hits is not None else custom_q in question_lower
+            if contained or (reverse and question_lower in custom_q):
+                return custom_a
+        return None
+
     @staticmethod
     def _fit_to_options(answer: str, options: list[str] | None) -> str:
         """
@@ -191,26 +286,26 @@ class AnswerResolver:
 
         answer_lower = answer.lower().strip()
 
-        # Exact match (case-insensitive)
+        # Normalize each option once, returning early on an exact match
+        normalized = []
         for opt in options:
-            if opt.lower().strip() == answer_lower:
+            opt_lower = opt.lower().strip()
+            if opt_lower == answer_lower:
                 return opt
+            normalized.append((opt_lower, opt))
 
         # Substring match: answer contained in option or vice versa
-        for opt in options:
-            opt_lower = opt.lower().strip()
+        for opt_lower, opt in normalized:
             if answer_lower in opt_lower or opt_lower in answer_lower:
                 return opt
 
         # Yes/No normalization
-        if answer_lower in ("yes", "true", "1"):
-            for opt in options:
-                if opt.lower().strip() in ("yes", "true", "1"):
-                    return opt
-        if answer_lower in ("no", "false", "0"):
-            for opt in options:
-                if opt.lower().strip() in ("no", "false", "0"):
-                    return opt
+        for group in _BOOLEAN_ANSWERS:
+            if answer_lower in group:
+                for opt_lower, opt in normalized:
+                    if opt_lower in group:
+                        return opt
+                break
 
         # No match found — return original answer
         return answer
@@ -13,16 +13,147 @@ Maintains single source of truth with platform-specific transformations.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it (same safe subset)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_sidecar(sidecar: Path, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Profile data from a JSON sidecar written for this exact YAML version."""
+    try:
+        cached = json.loads(sidecar.read_bytes())
+        if cached["source"] == [mtime_ns, size] and isinstance(cached["data"], dict):
+            data: dict[str, Any] = cached["data"]
+            return data
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_sidecar(sidecar: Path, mtime_ns: int, size: int, data: dict[str, Any]) -> None:
+    """Atomically store *data* as JSON for the next process, when it round-trips."""
+    try:
+        encoded = json.dumps(data, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return  # e.g. YAML dates; keep parsing the YAML
+    # Non-string keys would come back as strings, so only cache exact copies
+    if json.loads(encoded) != data:
+        return
+    _write_cache_file(sidecar, f'{{"source":[{mtime_ns},{size}],"data":{encoded}}}')
+
+
+def _write_cache_file(path: Path, text: str) -> None:
+    """Atomically replace *path* with *text*; skipped if the directory is read-only."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _write_files(files: list[tuple[Path, str]]) -> None:
+    """Write generated text files as UTF-8, overlapping the writes on a few threads."""
+    with ThreadPoolExecutor(max_workers=min(4, len(files))) as pool:
+        # Consuming the results re-raises the first failed write
+        list(pool.map(lambda item: item[0].write_bytes(item[1].encode()), files))
+
+
+def _read_text_or_none(path: Path) -> str | None:
+    """File contents, or None when it can't be read."""
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _load_profile_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse the master profile once per (path, mtime, size).
+
+    The stat fields key the cache so edits to the profile invalidate the
+    entry. Across processes, a ``<profile>.json`` sidecar tagged with the
+    YAML's mtime and size skips the YAML parse.
+    """
+    sidecar = Path(f"{path}.json")
+    data = _read_sidecar(sidecar, mtime_ns, size)
+    if data is not None:
+        return data
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    if not isinstance(data, dict):
+        return {}
+    _write_sidecar(sidecar, mtime_ns, size, data)
+    return data
+
+
+# LaTeX patterns used by sync_resume, compiled once
+_LATEX_FIELDS_RE = re.compile(r"\\def\\(name|phone|email|linkedin|github)\{[^}]*\}")
+_HEADLINE_RE = re.compile(r"\\textbf{[^}]+\\textbullet[^}]+}")
+
+# Plain-text profile values are escaped for LaTeX in one translate() pass
+_LATEX_ESCAPE = str.maketrans({"&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#", "_": r"\_"})
+
+# Section markers in master.tex; a section runs up to the next one
+_EXPERIENCE_MARKER = "%-----------EXPERIENCE-----------"
+_PROJECTS_MARKER = "%-----------PROJECTS-----------"
+_EDUCATION_MARKER = "%-----------EDUCATION-----------"
+
+
+def _splice_sections(content: str, sections: list[tuple[str, str, str]]) -> str:
+    """Replace marker-delimited sections of *content* in a single rebuild.
+
+    Each ``(start, end, text)`` entry replaces the span from the first
+    *start* marker up to (not including) the next *end* marker with *text*.
+    Entries whose markers are missing leave the content untouched.
+    """
+    spans = []
+    for start, end, text in sections:
+        i = content.find(start)
+        if i < 0:
+            continue
+        j = content.find(end, i + len(start))
+        if j >= 0:
+            spans.append((i, j, text))
+    if not spans:
+        return content
+
+    parts = []
+    pos = 0
+    for i, j, text in sorted(spans):
+        if i < pos:
+            continue  # Markers out of order: keep the earlier section's edit
+        parts.append(content[pos:i])
+        parts.append(text)
+        pos = j
+    parts.append(content[pos:])
+    return "".join(parts)
+
+
+def _ltx(text: str) -> str:
+    """Escape LaTeX special characters in a profile value."""
+    return text.translate(_LATEX_ESCAPE)
+
+
+@lru_cache(maxsize=32)
+def _latex_def_pattern(field: str) -> re.Pattern[str]:
+    """Compiled ``\\def\\<field>{...}`` pattern."""
+    return re.compile(r"\\def\\" + re.escape(field) + r"\{[^}]*\}")
+
 
 class Platform(Enum):
     RESUME = "resume"
@@ -55,12 +186,14 @@ class PlatformSyncManager:
         self.sync_log: list[SyncResult] = []
 
     def _load_profile(self) -> dict[str, Any]:
-        """Load master profile."""
-        with open(self.profile_path) as f:
-            data = yaml.safe_load(f)
-        if isinstance(data, dict):
-            return data
-        return {}
+        """
+        Load master profile.
+
+        The parsed profile is cached per process and shared between managers,
+        so it must not be mutated.
+        """
+        st = self.profile_path.stat()
+        return _load_profile_cached(str(self.profile_path.absolute()), st.st_mtime_ns, st.st_size)
 
     def reload_profile(self) -> None:
         """Reload profile from disk."""
@@ -94,25 +227,35 @@ class PlatformSyncManager:
 
             # Update personal info
             personal = self.profile["personal"]
-            content = self._update_latex_field(content, "name", personal["name"]["full"])
-            content = self._update_latex_field(content, "phone", personal["contact"]["phone"])
-            content = self._update_latex_field(content, "email", personal["contact"]["email"])
-            content = self._update_latex_field(content, "linkedin", personal["social"]["linkedin"])
-            content = self._update_latex_field(content, "github", personal["social"]["github"])
+            content = self._update_latex_fields(
+                content,
+                {
+                    "name": personal["name"]["full"],
+                    "phone": personal["contact"]["phone"],
+                    "email": personal["contact"]["email"],
+                    "linkedin": personal["social"]["linkedin"],
+                    "github": personal["social"]["github"],
+                },
+            )
 
             # Update headline
             content = self._update_latex_headline(content, personal["headlines"]["resume"])
 
-            # Update projects section
-            content = self._sync_projects_section(content)
-
-            # Update experience section
-            content = self._sync_experience_section(content)
+            # Update experience and projects sections
+            content = self._sync_sections(content)
 
-            # Backup and save
+            # Backup and save: the backup is a hardlink to the current file,
+            # which keeps the old contents once the new file is renamed over it
             backup_path = resume_path.with_suffix(".tex.bak")
-            shutil.copy(resume_path, backup_path)
-            resume_path.write_text(content)
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(resume_path, backup_path)
+            except OSError:
+                shutil.copy(resume_path, backup_path)  # No hardlinks on this filesystem
+            tmp_path = resume_path.with_suffix(".tex.tmp")
+            tmp_path.write_text(content)
+            shutil.copymode(resume_path, tmp_path)
+            os.replace(tmp_path, resume_path)
 
             files_updated.append(str(resume_path))
 
@@ -134,98 +277,120 @@ class PlatformSyncManager:
 
     def _update_latex_field(self, content: str, field: str, value: str) -> str:
         """Update a LaTeX field definition."""
-        # Use re.escape for the field name and proper escaping for \def
-        pattern = r"\\def\\" + re.escape(field) + r"\{[^}]*\}"
+        # Content is returned unchanged if the resume has no such \def macro
         replacement = r"\\def\\" + field + "{" + value + "}"
-        # Only replace if pattern exists (resume may not use \def macros)
-        if re.search(pattern, content):
-            return re.sub(pattern, replacement, content)
-        return content
+        return _latex_def_pattern(field).sub(replacement, content)
+
+    def _update_latex_fields(self, content: str, values: dict[str, str]) -> str:
+        """Update the personal-info \\def macros in one pass over the resume."""
+        return _LATEX_FIELDS_RE.sub(
+            lambda m: f"\\def\\{m.group(1)}{{{values[m.group(1)]}}}", content
+        )
 
     def _update_latex_headline(self, content: str, headline: str) -> str:
         """Update the headline/tagline in LaTeX resume."""
         # Look for headline pattern
-        pattern = r"\\textbf{[^}]+\\textbullet[^}]+}"
-        return re.sub(pattern, f"\\\\textbf{{{headline}}}", content)
+        return _HEADLINE_RE.sub(f"\\\\textbf{{{headline}}}", content)
+
+    def _sync_sections(self, content: str) -> str:
+        """Replace the Experience and Projects sections in one pass over the resume."""
+        sections = []
+        experience = self._build_experience_section()
+        if experience is not None:
+            sections.append((_EXPERIENCE_MARKER, _PROJECTS_MARKER, experience))
+        projects = self._build_projects_section()
+        if projects is not None:
+            sections.append((_PROJECTS_MARKER, _EDUCATION_MARKER, projects))
+        return _splice_sections(content, sections)
 
     def _sync_projects_section(self, content: str) -> str:
         """Replace the Projects section in LaTeX with projects from master profile."""
+        section = self._build_projects_section()
+        if section is None:
+            return content
+        return _splice_sections(content, [(_PROJECTS_MARKER, _EDUCATION_MARKER, section)])
+
+    def _build_projects_section(self) -> str | None:
+        """LaTeX for the Projects section, or None when the profile has no projects."""
         projects = self.profile.get("projects", [])
         if not projects:
-            return content
+            return None
 
         # Build LaTeX for each project
         entries = []
         for project in projects:
-            name = project["name"]
-            tech = ", ".join(project.get("technologies", []))
-            # Escape LaTeX special characters
-            name = name.replace("&", r"\&")
-            tech = tech.replace("&", r"\&")
+            name = _ltx(project["name"])
+            tech = _ltx(", ".join(project.get("technologies", [])))
 
             highlights = project.get("highlights", [])
             # Use first 2 highlights as resume bullets
             bullets = highlights[:2]
 
-            entry = "      \\resumeProjectHeading\n"
-            entry += f"          {{\\textbf{{{name}}} $|$ \\emph{{{tech}}}}}{{}}  \n"
+            entry = [
+                "      \\resumeProjectHeading\n",
+                f"          {{\\textbf{{{name}}} $|$ \\emph{{{tech}}}}}{{}}  \n",
+            ]
             if bullets:
-                entry += "          \\resumeItemListStart\n"
+                entry.append("          \\resumeItemListStart\n")
                 for bullet in bullets:
-                    bullet = bullet.replace("&", r"\&").replace("%", r"\%")
-                    entry += f"            \\resumeItem{{{bullet}}}\n"
-                entry += "          \\resumeItemListEnd\n"
-            entries.append(entry)
-
-        new_section = "%-----------PROJECTS-----------\n"
-        new_section += "\\section{Projects}\n"
-        new_section += "    \\resumeSubHeadingListStart\n\n"
-        new_section += "\n".join(entries)
-        new_section += "\n    \\resumeSubHeadingListEnd\n"
-
-        # Replace between PROJECTS marker and EDUCATION marker
-        pattern = r"%-----------PROJECTS-----------.*?(?=%-----------EDUCATION-----------)"
-        # Use lambda to avoid re.sub interpreting backslashes in replacement
-        result = re.sub(pattern, lambda _: new_section + "\n", content, flags=re.DOTALL)
-        return result
+                    entry.append(f"            \\resumeItem{{{_ltx(bullet)}}}\n")
+                entry.append("          \\resumeItemListEnd\n")
+            entries.append("".join(entry))
+
+        return "".join(
+            [
+                _PROJECTS_MARKER + "\n",
+                "\\section{Projects}\n",
+                "    \\resumeSubHeadingListStart\n\n",
+                "\n".join(entries),
+                "\n    \\resumeSubHeadingListEnd\n\n",
+            ]
+        )
 
     def _sync_experience_section(self, content: str) -> str:
         """Replace the Experience section in LaTeX with experience from master profile."""
+        section = self._build_experience_section()
+        if section is None:
+            return content
+        return _splice_sections(content, [(_EXPERIENCE_MARKER, _PROJECTS_MARKER, section)])
+
+    def _build_experience_section(self) -> str | None:
+        """LaTeX for the Experience section, or None when the profile has no experience."""
         experiences = self.profile.get("experience", [])
         if not experiences:
-            return content
+            return None
 
         entries = []
         for exp in experiences:
-            company = exp["company"].replace("&", r"\&")
-            role = exp["role"].replace("&", r"\&")
-            location = exp.get("location", "Remote").replace("&", r"\&")
+            company = _ltx(exp["company"])
+            role = _ltx(exp["role"])
+            location = _ltx(exp.get("location", "Remote"))
             start = exp.get("start_date", "")
             end = exp.get("end_date") or "Present"
 
-            entry = "      \\resumeSubheading\n"
-            entry += f"        {{{role}}}{{{start} -- {end}}}\n"
-            entry += f"        {{{company}}}{{{location}}}\n"
+            entry = [
+                "      \\resumeSubheading\n",
+                f"        {{{role}}}{{{start} -- {end}}}\n",
+                f"        {{{company}}}{{{location}}}\n",
+            ]
 
             bullets = exp.get("bullets", [])
             if bullets:
-                entry += "        \\resumeItemListStart\n"
+                entry.append("        \\resumeItemListStart\n")
                 for bullet in bullets:
-                    text = bullet["text"].replace("&", r"\&").replace("%", r"\%")
-                    entry += f"          \\resumeItem{{{text}}}\n"
-                entry += "        \\resumeItemListEnd\n"
-            entries.append(entry)
-
-        new_section = "%-----------EXPERIENCE-----------\n"
-        new_section += "\\section{Experience}\n"
-        new_section += "  \\resumeSubHeadingListStart\n\n"
-        new_section += "\n".join(entries)
-        new_section += "\n  \\resumeSubHeadingListEnd\n"
-
-        # Replace between EXPERIENCE marker and PROJECTS marker
-        pattern = r"%-----------EXPERIENCE-----------.*?(?=%-----------PROJECTS-----------)"
-        result = re.sub(pattern, lambda _: new_section + "\n", content, flags=re.DOTALL)
-        return result
+                    entry.append(f"          \\resumeItem{{{_ltx(bullet['text'])}}}\n")
+                entry.append("        \\resumeItemListEnd\n")
+            entries.append("".join(entry))
+
+        return "".join(
+            [
+                _EXPERIENCE_MARKER + "\n",
+                "\\section{Experience}\n",
+                "  \\resumeSubHeadingListStart\n\n",
+                "\n".join(entries),
+                "\n  \\resumeSubHeadingListEnd\n\n",
+            ]
+        )
 
     def _compile_resume_pdf(self) -> str | None:
         """Compile the master LaTeX resume to PDF. Returns PDF path or None."""
@@ -235,24 +400,36 @@ class PlatformSyncManager:
         if not resume_path.exists():
             return None
 
+        exports_dir = self.root / "resume" / "exports"
+        export_path = exports_dir / "resume.pdf"
+        hash_path = exports_dir / "resume.pdf.sha"
+
+        # Skip pdflatex when the exported PDF was built from this exact source
+        source_hash = hashlib.blake2b(resume_path.read_bytes(), digest_size=16).hexdigest()
+        if export_path.exists() and _read_text_or_none(hash_path) == source_hash:
+            return str(export_path)
+
         try:
-            for _ in range(2):
-                subprocess.run(
-                    ["pdflatex", "-interaction=nonstopmode", resume_path.name],
+            # The first pass only needs to write the .aux file, so it skips PDF
+            # output; pdflatex keeps its own .log, so stdout is discarded
+            for draft in (["-draftmode"], []):
+                proc = subprocess.run(
+                    ["pdflatex", "-interaction=nonstopmode", *draft, resume_path.name],
                     cwd=resume_path.parent,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=60,
                 )
 
             pdf_path = resume_path.with_suffix(".pdf")
             if pdf_path.exists():
                 # Copy to exports
-                exports_dir = self.root / "resume" / "exports"
                 exports_dir.mkdir(parents=True, exist_ok=True)
-                import shutil
-
-                export_path = exports_dir / "resume.pdf"
                 shutil.copy(pdf_path, export_path)
+                if proc.returncode == 0:
+                    _write_cache_file(hash_path, source_hash)
+                else:
+                    hash_path.unlink(missing_ok=True)  # Rebuild next time
                 return str(export_path)
         except FileNotFoundError:
             pass  # pdflatex not installed
@@ -281,30 +458,21 @@ class PlatformSyncManager:
         try:
             self.profile["personal"]  # Validate key exists before proceeding
 
-            # Generate headline options
-            headline_content = self._generate_linkedin_headlines()
-            (linkedin_dir / "headlines.md").write_text(headline_content)
-            files_updated.append("linkedin/profile/headlines.md")
-
-            # Generate about section
             about_content = self.profile["summaries"]["linkedin"]
-            (linkedin_dir / "about.md").write_text(f"# LinkedIn About Section\n\n{about_content}")
-            files_updated.append("linkedin/profile/about.md")
-
-            # Generate experience descriptions
-            exp_content = self._generate_linkedin_experience()
-            (linkedin_dir / "experience.md").write_text(exp_content)
-            files_updated.append("linkedin/profile/experience.md")
-
-            # Generate skills list
-            skills_content = self._generate_linkedin_skills()
-            (linkedin_dir / "skills.md").write_text(skills_content)
-            files_updated.append("linkedin/profile/skills.md")
-
-            # Generate sync instructions
-            instructions = self._generate_linkedin_instructions()
-            (linkedin_dir / "SYNC_INSTRUCTIONS.md").write_text(instructions)
-            files_updated.append("linkedin/profile/SYNC_INSTRUCTIONS.md")
+            files = [
+                # Headline options
+                (linkedin_dir / "headlines.md", self._generate_linkedin_headlines()),
+                # About section
+                (linkedin_dir / "about.md", f"# LinkedIn About Section\n\n{about_content}"),
+                # Experience descriptions
+                (linkedin_dir / "experience.md", self._generate_linkedin_experience()),
+                # Skills list
+                (linkedin_dir / "skills.md", self._generate_linkedin_skills()),
+                # Sync instructions
+                (linkedin_dir / "SYNC_INSTRUCTIONS.md", self._generate_linkedin_instructions()),
+            ]
+            _write_files(files)
+            files_updated.extend(path.relative_to(self.root).as_posix() for path, _ in files)
 
         except Exception as e:
             errors.append(f"LinkedIn sync failed: {str(e)}")
@@ -349,13 +517,13 @@ class PlatformSyncManager:
         """Generate LinkedIn experience descriptions."""
         experiences = self.profile.get("experience", [])
 
-        content = "# LinkedIn Experience Descriptions\n\n"
+        parts = ["# LinkedIn Experience Descriptions\n\n"]
 
         for exp in experiences:
             end_date = exp.get("end_date") or "Present"
             bullets = "\n".join([f"• {b['text']}" for b in exp.get("bullets", [])])
 
-            content += f"""
+            parts.append(f"""
 ## {exp["company"]}
 
 **{exp["role"]}** | {exp.get("location", "Remote")} | {exp["start_date"]} - {end_date}
@@ -367,32 +535,30 @@ class PlatformSyncManager:
 {bullets}
 
 ---
-"""
+""")
 
-        return content
+        return "".join(parts)
 
     def _generate_linkedin_skills(self) -> str:
         """Generate LinkedIn skills list."""
         skills_config = self.profile.get("skills", {})
         linkedin_skills = skills_config.get("linkedin_skills", {})
 
-        content = "# LinkedIn Skills\n\n"
+        parts = ["# LinkedIn Skills\n\n", "## Top 3 (Pin These)\n"]
+        parts.extend(f"- {skill}\n" for skill in linkedin_skills.get("primary", []))
 
-        content += "## Top 3 (Pin These)\n"
-        for skill in linkedin_skills.get("primary", []):
-            content += f"- {skill}\n"
+        parts.append("\n## Secondary Skills (Get Endorsements)\n")
+        parts.extend(f"- {skill}\n" for skill in linkedin_skills.get("secondary", []))
 
-        content += "\n## Secondary Skills (Get Endorsements)\n"
-        for skill in linkedin_skills.get("secondary", []):
-            content += f"- {skill}\n"
-
-        content += "\n## All Skills by Category\n"
+        parts.append("\n## All Skills by Category\n")
         for category in skills_config.get("categories", []):
-            content += f"\n### {category['name']}\n"
-            for skill in category.get("skills", []):
-                content += f"- {skill['name']} ({skill.get('proficiency', 'proficient')})\n"
+            parts.append(f"\n### {category['name']}\n")
+            parts.extend(
+                f"- {skill['name']} ({skill.get('proficiency', 'proficient')})\n"
+                for skill in category.get("skills", [])
+            )
 
-        return content
+        return "".join(parts)
 
     def _generate_linkedin_instructions(self) -> str:
         """Generate instructions for LinkedIn sync."""
@@ -446,9 +612,7 @@ Source: master_profile.yaml
         github_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            readme_content = self._generate_github_readme()
-            (github_dir / "README.md").write_text(readme_content)
-            files_updated.append("github/profile/README.md")
+            files = [(github_dir / "README.md", self._generate_github_readme())]
 
             # Generate repo-specific READMEs
             for project in self.profile.get("projects", []):
@@ -456,8 +620,10 @@ Source: master_profile.yaml
                     repo_readme = self._generate_repo_readme(project)
                     repo_dir = github_dir.parent / "repos" / project["id"]
                     repo_dir.mkdir(parents=True, exist_ok=True)
-                    (repo_dir / "README.md").write_text(repo_readme)
-                    files_updated.append(f"github/repos/{project['id']}/README.md")
+                    files.append((repo_dir / "README.md", repo_readme))
+
+            _write_files(files)
+            files_updated.extend(path.relative_to(self.root).as_posix() for path, _ in files)
 
         except Exception as e:
             errors.append(f"GitHub sync failed: {str(e)}")
@@ -478,27 +644,28 @@ Source: master_profile.yaml
         projects = [p for p in self.profile.get("projects", []) if p.get("pinned")]
 
         # Experience highlights
-        exp_table = "| Company | Role | Highlight |\n|---------|------|-----------|"
+        exp_rows = ["| Company | Role | Highlight |\n|---------|------|-----------|"]
         for exp in experiences:
             highlight = (
                 exp.get("bullets", [{}])[0].get("text", "")[:80] + "..."
                 if exp.get("bullets")
                 else ""
             )
-            exp_table += f"\n| **{exp['company']}** | {exp['role']} | {highlight} |"
+            exp_rows.append(f"| **{exp['company']}** | {exp['role']} | {highlight} |")
+        exp_table = "\n".join(exp_rows)
 
         # Skills section
         skills = self.profile.get("skills", {}).get("categories", [])
-        skills_block = ""
-        for cat in skills[:4]:
-            skill_names = " │ ".join([s["name"] for s in cat.get("skills", [])[:5]])
-            skills_block += f"{cat['name']:12}: {skill_names}\n"
+        skills_block = "".join(
+            f"{cat['name']:12}: {' │ '.join([s['name'] for s in cat.get('skills', [])[:5]])}\n"
+            for cat in skills[:4]
+        )
 
         # Projects section
-        projects_section = ""
+        project_parts = []
         for project in projects[:2]:
             highlights = "\n".join([f"- {h}" for h in project.get("highlights", [])[:4]])
-            projects_section += f"""
+            project_parts.append(f"""
 ### {project.get("name", project["id"])}
 {project.get("tagline", "")}
 
@@ -506,7 +673,8 @@ Source: master_profile.yaml
 
 [![Repo](https://img.shields.io/badge/GitHub-Repo-181717?style=flat&logo=github)]({project.get("repo_url", "#")})
 
-"""
+""")
+        projects_section = "".join(project_parts)
 
         return f"""<div align="center">
 
@@ -694,7 +862,10 @@ title: {personal["name"]["full"]}
             platform: Which platform to sync, or ALL for all platforms
 
         Returns:
-            List of sync results
+            List of sync results, in platform order
+
+        With ALL, the platforms are synced concurrently: each writes its own
+        directory and only reads the shared profile.
         """
         results = []
 
@@ -706,8 +877,9 @@ title: {personal["name"]["full"]}
         }
 
         if platform == Platform.ALL:
-            for _p, func in sync_funcs.items():
-                results.append(func())
+            with ThreadPoolExecutor(max_workers=len(sync_funcs)) as pool:
+                futures = [pool.submit(func) for func in sync_funcs.values()]
+                results = [future.result() for future in futures]
         else:
             if platform in sync_funcs:
                 results.append(sync_funcs[platform]())
@@ -717,23 +889,25 @@ title: {personal["name"]["full"]}
 
     def get_sync_status(self) -> str:
         """Get formatted sync status report."""
-        report = "# Platform Sync Status\n\n"
-        report += f"**Profile**: {self.profile_path}\n"
-        report += f"**Last Check**: {datetime.now().isoformat()}\n\n"
+        report = [
+            "# Platform Sync Status\n\n",
+            f"**Profile**: {self.profile_path}\n",
+            f"**Last Check**: {datetime.now().isoformat()}\n\n",
+        ]
 
         if not self.sync_log:
-            report += "*No syncs performed yet*\n"
+            report.append("*No syncs performed yet*\n")
         else:
-            report += "| Platform | Status | Files Updated | Last Sync |\n"
-            report += "|----------|--------|---------------|------------|\n"
+            report.append("| Platform | Status | Files Updated | Last Sync |\n")
+            report.append("|----------|--------|---------------|------------|\n")
 
             for result in self.sync_log[-4:]:  # Last 4 results
                 status = "✅" if result.success else "❌"
                 files = len(result.files_updated)
                 time = result.timestamp.strftime("%Y-%m-%d %H:%M")
-                report += f"| {result.platform.value} | {status} | {files} | {time} |\n"
+                report.append(f"| {result.platform.value} | {status} | {files} | {time} |\n")
 
-        return report
+        return "".join(report)
 
 
 def main() -> None:
@@ -0,0 +1,472 @@
+"""Tests for application submission helpers."""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.analysis.job_analyzer import JobAnalysis, JobAnalyzer
+from scripts.submission import application_submitter
+from scripts.submission.application_submitter import (
+    _FIELD_LABELS,
+    _PENDING_IO,
+    PlaywrightSession,
+    _default_session,
+    _ensure_playwright,
+    _find_analyzed_job,
+    _get_resolver,
+    _map_form_fields,
+    _route_request,
+    _upload_resume,
+    _write_in_background,
+    apply_to_job,
+    apply_to_jobs,
+    drain_pending_io,
+    get_resume_variant,
+    record_application,
+    validate_submission,
+    validate_submissions,
+    warm_browser,
+)
+
+
+@pytest.fixture()
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run against relative resume/ and jobs/ dirs under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _touch(path: Path, mtime: int = 1_700_000_000) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"%PDF")
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Resume variant lookup
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGetResumeVariant:
+    def test_job_specific_variant_wins(self, workdir):
+        _touch(workdir / "resume" / "variants" / "approved" / "newer.pdf", mtime=2_000_000_000)
+        _touch(workdir / "resume" / "variants" / "acme_job42.pdf")
+
+        assert get_resume_variant("job42") == Path("resume/variants/acme_job42.pdf")
+
+    def test_job_id_matched_literally(self, workdir):
+        # glob would have treated the brackets as a character class
+        _touch(workdir / "resume" / "variants" / "acme_[42].pdf")
+
+        assert get_resume_variant("[42]") == Path("resume/variants/acme_[42].pdf")
+
+    def test_latest_approved_variant(self, workdir):
+        approved = workdir / "resume" / "variants" / "approved"
+        _touch(approved / "old.pdf", mtime=1_000_000_000)
+        _touch(approved / "new.pdf", mtime=1_500_000_000)
+        _touch(approved / "notes.txt", mtime=1_900_000_000)
+
+        assert get_resume_variant("job42") == Path("resume/variants/approved/new.pdf")
+
+    def test_falls_back_to_exports(self, workdir):
+        _touch(workdir / "resume" / "exports" / "base.pdf")
+
+        assert get_resume_variant("job42") == Path("resume/exports/base.pdf")
+
+    def test_new_variant_seen_after_directory_changes(self, workdir):
+        variants = workdir / "resume" / "variants"
+        _touch(variants / "acme_job1.pdf")
+        assert get_resume_variant("job2") is None
+
+        _touch(variants / "acme_job2.pdf")
+        # Pin the directory mtime forward so a coarse clock can't hide the change
+        stat = variants.stat()
+        os.utime(variants, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert get_resume_variant("job2") == Path("resume/variants/acme_job2.pdf")
+
+    def test_none_when_nothing_exists(self, workdir):  # noqa: ARG002
+        assert get_resume_variant("job42") is None
+
+
+class TestApplyToJob:
+    def test_missing_job(self, workdir):  # noqa: ARG002
+        result = apply_to_job("job42")
+        assert result == {"status": "error", "message": "Job job42 not found"}
+
+    def test_job_found_without_resume(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "acme_job42.json").write_text('{"id": "job42"}')
+
+        result = apply_to_job("job42")
+        assert result == {"status": "error", "message": "No resume variant found"}
+
+    def test_job_found_through_analyzed_index(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "renamed.json").write_text('{"id": "job42"}')
+        (analyzed / "_index.json").write_text('{"job42": "renamed.json"}')
+
+        result = apply_to_job("job42")
+        assert result == {"status": "error", "message": "No resume variant found"}
+
+    def test_stale_index_entry_falls_back_to_scan(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "acme_job42.json").write_text('{"id": "job42"}')
+        (analyzed / "_index.json").write_text('{"job42": "deleted.json"}')
+
+        result = apply_to_job("job42")
+        assert result == {"status": "error", "message": "No resume variant found"}
+
+    def test_saved_analysis_indexed_over_corrupt_index(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "_index.json").write_text('{"job1": "acme_job1.js')
+        (workdir / "profile.yaml").write_text("{}")
+        analysis = JobAnalysis(
+            job_id="job42",
+            company="acme",
+            role="Engineer",
+            url="https://example.com/jobs/42",
+            location="Remote",
+            remote_policy="remote",
+            salary_range=None,
+            must_have=[],
+            nice_to_have=[],
+            keywords=[],
+            match_score=0.0,
+            matched_skills=[],
+            missing_skills=[],
+            tailoring_notes=[],
+            analyzed_at="2026-01-01T00:00:00",
+            raw_description="",
+        )
+
+        saved = JobAnalyzer(profile_path="profile.yaml").save_analysis(analysis)
+
+        index = json.loads((analyzed / "_index.json").read_text())
+        assert index == {"job42": saved.name}
+        assert sorted(p.name for p in analyzed.iterdir()) == ["_index.json", saved.name]
+        result = apply_to_job("job42")
+        assert result == {"status": "error", "message": "No resume variant found"}
+
+    def test_batch_without_submissions_never_launches_browser(self, workdir):  # noqa: ARG002
+        results = apply_to_jobs(["job1", "job2"])
+        assert [r["message"] for r in results] == ["Job job1 not found", "Job job2 not found"]
+
+    def test_concurrent_batch_keeps_input_order(self, workdir):  # noqa: ARG002
+        job_ids = [f"job{i}" for i in range(7)]
+        results = apply_to_jobs(job_ids, concurrency=3)
+        assert [r["message"] for r in results] == [f"Job {j} not found" for j in job_ids]
+
+    def test_default_session_shared_and_closed_at_exit(self, monkeypatch):
+        module = "scripts.submission.application_submitter"
+        monkeypatch.setattr(f"{module}._DEFAULT_SESSION", None)
+        registered = []
+        monkeypatch.setattr(f"{module}.atexit.register", registered.append)
+
+        session = _default_session()
+        assert _default_session() is session
+        assert registered == [session.close]
+
+    def test_warm_browser_needs_playwright(self, monkeypatch):
+        module = "scripts.submission.application_submitter"
+        monkeypatch.setattr(f"{module}._DEFAULT_SESSION", PlaywrightSession())
+        monkeypatch.setattr(f"{module}.PLAYWRIGHT_AVAILABLE", False)
+        with pytest.raises(RuntimeError, match="not installed"):
+            warm_browser()
+
+    def test_batch_reports_each_lookup_failure(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "job2.json").write_text(json.dumps({"id": "job2"}))
+
+        results = apply_to_jobs(["job1", "job2", "job3"])
+
+        assert [r["message"] for r in results] == [
+            "Job job1 not found",
+            "No resume variant found",
+            "Job job3 not found",
+        ]
+        assert apply_to_jobs([]) == []
+
+    def test_parsed_job_id_beats_substring(self, workdir):
+        analyzed = workdir / "jobs" / "analyzed"
+        analyzed.mkdir(parents=True)
+        (analyzed / "acme_job42_20260101.json").write_text("{}")
+        (analyzed / "beta_job4_20260101.json").write_text("{}")
+
+        assert _find_analyzed_job("job4") == Path("jobs/analyzed/beta_job4_20260101.json")
+        assert _find_analyzed_job("42") == Path("jobs/analyzed/acme_job42_20260101.json")
+
+        (analyzed / "gamma_job7_20260102.json").write_text("{}")
+        os.utime(analyzed, ns=(0, analyzed.stat().st_mtime_ns + 1))
+        assert _find_analyzed_job("job7") == Path("jobs/analyzed/gamma_job7_20260102.json")
+
+    def test_unstarted_session_closes_cleanly(self):
+        with PlaywrightSession() as session:
+            pass
+        assert session._browser is None
+
+
+class TestEnsurePlaywright:
+    def test_probe_deferred_and_remembered(self, monkeypatch):
+        module = "scripts.submission.application_submitter"
+        monkeypatch.setattr(f"{module}.PLAYWRIGHT_AVAILABLE", None)
+        # A None entry makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, "playwright.sync_api", None)
+
+        assert _ensure_playwright() is False
+        assert sys.modules[module].PLAYWRIGHT_AVAILABLE is False
+
+    def test_missing_playwright_raises_on_first_page(self, monkeypatch):
+        monkeypatch.setattr("scripts.submission.application_submitter.PLAYWRIGHT_AVAILABLE", False)
+        with PlaywrightSession() as session, pytest.raises(RuntimeError, match="not installed"):
+            session.submit({"url": "https://example.com"})
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str, url: str):
+        self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+        self.outcome: str | None = None
+
+    def abort(self) -> None:
+        self.outcome = "abort"
+
+    def continue_(self) -> None:
+        self.outcome = "continue"
+
+
+class TestRouteRequest:
+    @pytest.mark.parametrize(
+        ("resource_type", "url", "outcome"),
+        [
+            ("document", "https://jobs.example.com/apply", "continue"),
+            ("stylesheet", "https://jobs.example.com/app.css", "continue"),
+            ("script", "https://jobs.example.com/form.js", "continue"),
+            ("image", "https://jobs.example.com/hero.png", "abort"),
+            ("font", "https://fonts.example.com/inter.woff2", "abort"),
+            ("script", "https://www.google-analytics.com/analytics.js", "abort"),
+        ],
+    )
+    def test_blocks_heavy_and_tracking_requests(self, resource_type, url, outcome):
+        route = _FakeRoute(resource_type, url)
+        _route_request(route)
+        assert route.outcome == outcome
+
+
+class TestPendingIO:
+    def test_drain_waits_for_writes(self, tmp_path):
+        paths = [tmp_path / f"shot{i}.jpg" for i in range(5)]
+        for path in paths:
+            _write_in_background(path, b"\xff\xd8")
+
+        drain_pending_io()
+        assert all(path.read_bytes() == b"\xff\xd8" for path in paths)
+
+    def test_drain_raises_failed_write_after_waiting(self, tmp_path):
+        _write_in_background(tmp_path / "missing" / "shot.jpg", b"")
+        _write_in_background(tmp_path / "ok.jpg", b"ok")
+
+        with pytest.raises(FileNotFoundError):
+            drain_pending_io()
+        assert (tmp_path / "ok.jpg").read_bytes() == b"ok"
+        drain_pending_io()  # Queue was cleared
+
+    def test_succeeded_writes_pruned(self, tmp_path):
+        for i in range(5):
+            _write_in_background(tmp_path / f"shot{i}.jpg", b"ok")
+        for future in list(_PENDING_IO):
+            future.result()
+        _write_in_background(tmp_path / "missing" / "shot.jpg", b"")
+        _PENDING_IO[-1].exception()
+
+        _write_in_background(tmp_path / "last.jpg", b"ok")
+        # Only the failed write and the newest one are still tracked
+        assert len(_PENDING_IO) == 2
+        with pytest.raises(FileNotFoundError):
+            drain_pending_io()
+
+    def test_single_job_screenshot_written_on_return(self, tmp_path, monkeypatch):
+        shot = tmp_path / "shot.jpg"
+
+        def fake_apply(*_args):
+            _write_in_background(shot, b"ok")
+            return {"status": "ready_for_review", "screenshot": str(shot)}
+
+        monkeypatch.setattr(application_submitter, "_load_job", lambda _id: (None, None))
+        monkeypatch.setattr(application_submitter, "_apply_loaded", fake_apply)
+
+        apply_to_job("job42")
+        assert shot.read_bytes() == b"ok"
+        assert _PENDING_IO == []
+
+        # A caller batching through its own session drains once at the end
+        apply_to_job("job43", session=object())
+        assert len(_PENDING_IO) == 1
+        drain_pending_io()
+
+
+class TestRecordApplication:
+    def test_record_filename_and_contents(self, workdir):  # noqa: ARG002
+        path = record_application(
+            {"id": "job42", "company": "Acme Labs Inc"}, {"status": "ready_for_review"}
+        )
+
+        assert path.parent == Path("jobs/applied")
+        assert path.name.startswith("acme_labs_inc_job42_")
+        record = json.loads(path.read_text())
+        assert record["status"] == "ready_for_review"
+        assert record["job"]["company"] == "Acme Labs Inc"
+
+
+class TestValidateSubmissions:
+    def test_results_in_input_order(self, workdir):
+        resume = workdir / "resume.pdf"
+        resume.write_bytes(b"%PDF" + b"0" * 2000)
+        good = {"company": "Acme", "title": "Engineer", "ats_score": 90, "match_score": 85}
+        weak = {**good, "company": "Beta", "ats_score": 40}
+
+        results = validate_submissions([(good, resume), (weak, resume), (good, None)])
+
+        assert results[0] == {"valid": True, "errors": []}
+        assert results[1]["errors"] == ["ATS score too low: 40% (minimum 70%)"]
+        assert results[2]["errors"] == ["Resume variant not found"]
+
+
+class TestValidateSubmission:
+    class _Tracker:
+        def __init__(self):
+            self.calls = 0
+
+        def is_already_applied(self, *_args):
+            self.calls += 1
+            return None
+
+    def test_db_not_consulted_when_score_too_low(self, workdir):
+        resume = workdir / "resume.pdf"
+        resume.write_bytes(b"%PDF" + b"0" * 2000)
+        job = {"company": "Acme", "title": "Engineer", "ats_score": 90, "match_score": 50}
+        tracker = self._Tracker()
+
+        result = validate_submission(job, resume, tracker=tracker)
+
+        assert result == {"valid": False, "errors": ["Match score too low: 50% (minimum 70%)"]}
+        assert tracker.calls == 0
+
+        result = validate_submission({**job, "match_score": 85}, resume, tracker=tracker)
+        assert result == {"valid": True, "errors": []}
+        assert tracker.calls == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Form filling
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFieldLabels:
+    @pytest.mark.parametrize(
+        ("field", "label"),
+        [
+            ("name", "Full Name *"),
+            ("name", "Name"),
+            ("email", "Email address"),
+            ("phone", "Mobile phone number"),
+            ("linkedin", "LinkedIn Profile URL"),
+            ("website", "Portfolio / Website"),
+            ("location", "Current city"),
+        ],
+    )
+    def test_label_matches_field(self, field, label):
+        assert re.search(_FIELD_LABELS[field], label, re.I)
+
+    @pytest.mark.parametrize(
+        ("field", "label"),
+        [("name", "Company name"), ("name", "Hiring manager name"), ("email", "Your phone")],
+    )
+    def test_label_does_not_match_other_fields(self, field, label):
+        assert not re.search(_FIELD_LABELS[field], label, re.I)
+
+
+class TestMapFormFields:
+    def test_known_nonempty_fields_in_input_order(self):
+        fields = _map_form_fields({"phone": "555", "email": "", "github": "x", "name": "Ada"})
+
+        assert fields == [
+            {
+                "name": "phone",
+                "type": "textbox",
+                "value": "555",
+                "patterns": ["phone", "mobile", "telephone"],
+            },
+            {
+                "name": "name",
+                "type": "textbox",
+                "value": "Ada",
+                "patterns": ["name", "full name", "your name"],
+            },
+        ]
+
+    def test_callers_get_their_own_pattern_lists(self):
+        _map_form_fields({"name": "Ada"})[0]["patterns"].append("x")
+        assert "x" not in _map_form_fields({"name": "Ada"})[0]["patterns"]
+
+
+class TestGetResolver:
+    def test_shared_until_profile_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.submission.application_submitter.ANSWERS_CONFIG_DIR", tmp_path)
+        profile = tmp_path / "master_profile.yaml"
+        profile.write_text("application_answers:\n  start_date: Immediately\n")
+
+        first = _get_resolver()
+        assert _get_resolver() is first
+        assert first.answers == {"start_date": "Immediately"}
+
+        profile.write_text("application_answers:\n  start_date: Two weeks\n")
+        os.utime(profile, ns=(0, profile.stat().st_mtime_ns + 1))
+        assert _get_resolver().answers == {"start_date": "Two weeks"}
+
+    def test_missing_profile_gives_empty_resolver(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("scripts.submission.application_submitter.ANSWERS_CONFIG_DIR", tmp_path)
+        assert _get_resolver().answers == {}
+
+
+class _FakeFileInput:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.calls: list[tuple[str, float]] = []
+
+    def set_input_files(self, path: str, timeout: float) -> None:
+        self.calls.append((path, timeout))
+        if self.error:
+            raise self.error
+
+
+class _FakePage:
+    def __init__(self, file_input: _FakeFileInput):
+        self.file_input = file_input
+        self.selectors: list[str] = []
+
+    def locator(self, selector: str):
+        self.selectors.append(selector)
+        return type("Locator", (), {"first": self.file_input})()
+
+
+class TestUploadResume:
+    def test_single_lookup_with_short_timeout(self):
+        page = _FakePage(_FakeFileInput())
+
+        assert _upload_resume(page, "resume.pdf") is True
+        assert page.selectors == ['input[type="file"]']
+        assert page.file_input.calls == [("resume.pdf", 2000)]
+
+    def test_no_file_input(self):
+        page = _FakePage(_FakeFileInput(TimeoutError("no file input")))
+        assert _upload_resume(page, "resume.pdf") is False
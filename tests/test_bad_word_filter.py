@@ -121,6 +121,20 @@ class TestBadWordFiltering:
         assert result[0]["company"] == "B"
         assert result[1]["company"] == "A"
 
+    def test_priority_outranks_penalty(self, targets_with_bad_words):
+        targets = {
+            **targets_with_bad_words,
+            "tiers": {"tier1": {"companies": [{"name": "A", "priority": 1}]}},
+        }
+        jobs = [
+            {"company": "B", "title": "Senior Engineer", "description": "test"},
+            {"company": "C", "title": "Staff Engineer", "description": "test"},
+            {"company": "A", "title": "Junior Engineer", "description": "test"},
+        ]
+        result = apply_targets_filter(jobs, targets)
+        # A is tier1 (priority 1) despite its penalty; B and C keep input order
+        assert [j["company"] for j in result] == ["A", "B", "C"]
+
     def test_soft_filter_keeps_all_jobs(self, targets_with_bad_words):
         """Bad words are soft penalties, not hard exclusions."""
         jobs = [
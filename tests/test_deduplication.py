@@ -1,9 +1,13 @@
 """Tests for applied jobs deduplication."""
 
+import struct
 from datetime import datetime
 
+import pandas as pd
 import pytest
 
+from scripts.discovery import job_searcher
+from scripts.discovery.job_searcher import SeenJobsFilter, deduplicate_jobs
 from scripts.tracking.tracker import Application, ApplicationTracker
 
 
@@ -206,3 +210,149 @@ class TestFilterAlreadyApplied:
         assert len(new) == 1
         assert len(applied) == 2
         assert new[0]["company"] == "D"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Cross-run dedup (SeenJobsFilter)
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSeenJobsFilter:
+    def test_added_url_is_seen(self):
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        assert "https://example.com/jobs/1" in bloom
+        assert "https://example.com/jobs/2" not in bloom
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        path = tmp_path / "seen.bloom"
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        bloom.save(path)
+
+        loaded = SeenJobsFilter.load(path)
+        assert "https://example.com/jobs/1" in loaded
+        assert len(loaded) == 1
+        assert loaded.error_rate == bloom.error_rate
+        assert [(b.capacity, b.num_bits, b.num_hashes) for b in loaded.slices] == [
+            (b.capacity, b.num_bits, b.num_hashes) for b in bloom.slices
+        ]
+
+    def test_grows_past_capacity(self, tmp_path):
+        bloom = SeenJobsFilter(capacity=100, error_rate=0.01)
+        urls = [f"https://example.com/jobs/{i}" for i in range(1000)]
+        for url in urls:
+            bloom.add(url)
+
+        assert [b.capacity for b in bloom.slices] == [100, 200, 400, 800]
+        assert len(bloom) <= 1000
+        path = tmp_path / "seen.bloom"
+        bloom.save(path)
+        loaded = SeenJobsFilter.load(path)
+        assert all(url in loaded for url in urls)
+        others = sum(f"https://example.com/other/{i}" in loaded for i in range(10_000))
+        assert others < 200  # Stays near the 1% target instead of saturating
+
+    def test_re_adding_does_not_count(self):
+        bloom = SeenJobsFilter(capacity=100)
+        for _ in range(3):
+            bloom.add("https://example.com/jobs/1")
+        assert len(bloom) == 1
+
+    def test_legacy_single_filter_file_loads(self, tmp_path):
+        path = tmp_path / "seen.bloom"
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        old = bloom.slices[0]
+        path.write_bytes(struct.pack("<QI", old.num_bits, old.num_hashes) + old.bits)
+
+        loaded = SeenJobsFilter.load(path)
+        assert "https://example.com/jobs/1" in loaded
+        loaded.add("https://example.com/jobs/2")
+        # New URLs go to a fresh slice rather than the uncounted old one
+        assert len(loaded.slices) == 2
+        assert loaded.slices[1].count == 1
+
+    def test_default_path_resolved_at_call_time(self, tmp_path, monkeypatch):
+        path = tmp_path / "seen.bloom"
+        monkeypatch.setattr(job_searcher, "SEEN_JOBS_PATH", path)
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        bloom.save()
+
+        assert path.exists()
+        assert "https://example.com/jobs/1" in SeenJobsFilter.load()
+
+    def test_load_missing_file_is_empty(self, tmp_path):
+        loaded = SeenJobsFilter.load(tmp_path / "missing.bloom")
+        assert "https://example.com/jobs/1" not in loaded
+
+    @pytest.mark.parametrize("cut", [0, 5, -3])
+    def test_truncated_file_is_empty(self, tmp_path, cut):
+        path = tmp_path / "seen.bloom"
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        bloom.save(path)
+        path.write_bytes(path.read_bytes()[:cut])
+
+        loaded = SeenJobsFilter.load(path)
+        assert "https://example.com/jobs/1" not in loaded
+        loaded.add("https://example.com/jobs/2")
+        assert "https://example.com/jobs/2" in loaded
+
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        path = tmp_path / "seen.bloom"
+        SeenJobsFilter(capacity=100).save(path)
+        SeenJobsFilter(capacity=100).save(path)
+        assert [p.name for p in tmp_path.iterdir()] == ["seen.bloom"]
+
+    def test_deduplicate_skips_previously_seen(self):
+        bloom = SeenJobsFilter(capacity=100)
+        bloom.add("https://example.com/jobs/1")
+        jobs = [
+            {"job_url": "https://example.com/jobs/1", "company": "A", "title": "Eng"},
+            {"job_url": "https://example.com/jobs/2", "company": "B", "title": "Eng"},
+        ]
+        result = deduplicate_jobs(jobs, bloom)
+        assert [j["company"] for j in result] == ["B"]
+
+
+class TestSearchJobsMarksSeen:
+    @pytest.fixture
+    def seen(self, tmp_path, monkeypatch):
+        """The run's seen-jobs filter, plus a record of every save."""
+        bloom = SeenJobsFilter(capacity=100)
+        saved = []
+        monkeypatch.setattr(SeenJobsFilter, "load", classmethod(lambda _cls: bloom))
+        monkeypatch.setattr(SeenJobsFilter, "save", lambda self: saved.append(self))
+        monkeypatch.setattr(job_searcher, "DISCOVERED_DIR", tmp_path / "discovered")
+        monkeypatch.setattr(
+            job_searcher,
+            "scrape_jobs",
+            lambda **_kwargs: pd.DataFrame(
+                [{"job_url": "https://example.com/jobs/1", "company": "A", "title": "Eng"}]
+            ),
+        )
+        monkeypatch.setattr("scripts.tracking.ApplicationTracker", None)
+        return bloom, saved
+
+    def test_marked_after_results_written(self, seen):
+        bloom, saved = seen
+        result = job_searcher.search_jobs("eng")
+
+        assert result["count"] == 1
+        assert "https://example.com/jobs/1" in bloom
+        assert saved == [bloom]
+
+    def test_not_marked_when_write_fails(self, seen, monkeypatch):
+        bloom, saved = seen
+
+        def fail(*_args, **_kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(job_searcher.json, "dump", fail)
+        with pytest.raises(OSError):
+            job_searcher.search_jobs("eng")
+
+        assert "https://example.com/jobs/1" not in bloom
+        assert saved == []
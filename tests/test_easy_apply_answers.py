@@ -1,11 +1,39 @@
 """Tests for LinkedIn Easy Apply answer resolver."""
 
+import os
+import threading
+from types import SimpleNamespace
+
 import pytest
 import yaml
 
+from scripts.submission import easy_apply_answers
 from scripts.submission.easy_apply_answers import AnswerResolver, ResolvedAnswer
 
 
+class _FakeAutomaton:
+    """Stand-in for ahocorasick.Automaton: reports every stored word in a text."""
+
+    def __init__(self):
+        self.words: dict[str, int] = {}
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def add_word(self, word, value):
+        self.words[word] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, text):
+        for word, value in self.words.items():
+            start = text.find(word)
+            while start >= 0:
+                yield start + len(word) - 1, value
+                start = text.find(word, start + 1)
+
+
 @pytest.fixture
 def resolver():
     """Create a resolver with test answers."""
@@ -111,6 +139,13 @@ class TestPatternMatching:
         result = resolver.resolve("What is your favorite color?")
         assert result is None
 
+    def test_unconfigured_category_falls_through(self):
+        resolver = AnswerResolver(answers={"willing_to_relocate": "Yes"})
+        result = resolver.resolve(
+            "Would you need visa sponsorship, and are you willing to relocate?"
+        )
+        assert result.source == "application_answers.willing_to_relocate"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Custom answers tests
@@ -139,6 +174,79 @@ class TestCustomAnswers:
         assert result.answer == "Custom No"
         assert result.source == "custom_answers"
 
+    def test_first_matching_custom_answer_wins(self):
+        resolver = AnswerResolver(
+            custom_answers={"hear about": "First", "how did you hear about us": "Second"}
+        )
+        assert resolver.resolve("How did you hear about us?").answer == "First"
+
+    def test_question_inside_custom_question(self):
+        resolver = AnswerResolver(custom_answers={"Preferred pronouns (optional)": "they/them"})
+        assert resolver.resolve("Pronouns").answer == "they/them"
+        assert resolver.resolve("Favourite colour") is None
+
+    def test_shared_resolver_matches_in_every_thread(self):
+        resolver = AnswerResolver(custom_answers={"How did you hear about us?": "LinkedIn"})
+        resolver.custom_answers["Pronouns"] = "they/them"
+        barrier = threading.Barrier(4)
+        answers = []
+
+        def resolve():
+            barrier.wait()
+            answers.append(resolver.resolve("How did you hear about us?"))
+
+        threads = [threading.Thread(target=resolve) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert [a.answer for a in answers] == ["LinkedIn"] * 4
+
+
+class TestCustomAnswersAutomaton:
+    @pytest.fixture(autouse=True)
+    def fake_ahocorasick(self, monkeypatch):
+        monkeypatch.setattr(easy_apply_answers, "AHOCORASICK_AVAILABLE", True)
+        monkeypatch.setattr(
+            easy_apply_answers,
+            "ahocorasick",
+            SimpleNamespace(Automaton=_FakeAutomaton),
+            raising=False,
+        )
+
+    def test_automaton_built(self):
+        resolver = AnswerResolver(custom_answers={"Hear about": "LinkedIn"})
+        assert resolver._custom_index.automaton.words == {"hear about": 0}
+
+    def test_duplicate_keys_keep_first(self):
+        resolver = AnswerResolver(custom_answers={"Hear about": "First", "hear about": "Second"})
+        assert resolver._custom_index.automaton.words == {"hear about": 0}
+        assert resolver.resolve("How did you hear about us?").answer == "First"
+
+    def test_first_in_profile_order_wins(self):
+        resolver = AnswerResolver(
+            custom_answers={"about us": "First", "how did you hear about us": "Second"}
+        )
+        assert resolver.resolve("How did you hear about us?").answer == "First"
+
+    def test_question_inside_custom_question(self):
+        resolver = AnswerResolver(custom_answers={"Preferred pronouns (optional)": "they/them"})
+        assert resolver.resolve("Pronouns").answer == "they/them"
+
+    def test_no_hit_falls_through_to_patterns(self):
+        resolver = AnswerResolver(
+            answers={"visa_sponsorship": "No"}, custom_answers={"hear about": "LinkedIn"}
+        )
+        result = resolver.resolve("Do you require visa sponsorship?")
+        assert result.answer == "No"
+        assert result.source == "application_answers.visa_sponsorship"
+
+    def test_edited_answers_rebuild_automaton(self):
+        resolver = AnswerResolver(custom_answers={"hear about": "LinkedIn"})
+        resolver.custom_answers["Pronouns"] = "they/them"
+        assert resolver.resolve("Your pronouns").answer == "they/them"
+        assert "pronouns" in resolver._custom_index.automaton.words
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Dropdown option fitting tests
@@ -265,6 +373,20 @@ class TestFromProfile:
         resolver = AnswerResolver.from_profile(path)
         assert resolver.answers == {}
 
+    def test_profile_not_mutated_and_edits_picked_up(self, tmp_path):
+        path = tmp_path / "profile.yaml"
+        path.write_text(
+            yaml.dump({"application_answers": {"start_date": "Now", "custom_answers": {"q": "a"}}})
+        )
+        first = AnswerResolver.from_profile(path)
+        # The cached parse still carries custom_answers for the next resolver
+        assert AnswerResolver.from_profile(path) == first
+        assert first.custom_answers == {"q": "a"}
+
+        path.write_text(yaml.dump({"application_answers": {"start_date": "Two weeks"}}))
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+        assert AnswerResolver.from_profile(path).answers == {"start_date": "Two weeks"}
+
 
 class TestResolvedAnswer:
     def test_dataclass(self):
@@ -0,0 +1,319 @@
+"""Tests for the LinkedIn Content Manager."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from scripts.linkedin.linkedin_manager import LinkedInContentManager, PostType
+
+
+@pytest.fixture()
+def manager(tmp_path: Path) -> LinkedInContentManager:
+    """Manager rooted at an empty temp project (no master profile)."""
+    return LinkedInContentManager(project_root=str(tmp_path))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Drafts and scheduling
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestDrafts:
+    def test_draft_stored_with_markdown(self, manager):
+        post = manager.create_post_draft(PostType.INDUSTRY_COMMENTARY)
+
+        md_path = manager.drafts_dir / f"{post.id}.md"
+        assert md_path.exists()
+        assert not (manager.drafts_dir / f"{post.id}.json").exists()
+
+        data = manager.get_post(post.id)
+        assert data["id"] == post.id
+        assert data["type"] == "industry_commentary"
+        assert data["status"] == "draft"
+        assert data["scheduled_date"] is None
+        assert data["hashtags"] == post.hashtags
+        assert "{hashtags}" not in data["content"]
+
+        md = md_path.read_text(encoding="utf-8")
+        assert md.startswith(f"# {post.title}\n")
+        assert f"---\n\n{post.content}\n\n---\n\n**Hashtags**: " in md
+
+    def test_same_second_drafts_get_distinct_ids(self, manager):
+        first = manager.create_post_draft(PostType.TUTORIAL)
+        second = manager.create_post_draft(PostType.TUTORIAL)
+
+        assert first.id != second.id
+        assert {p["id"] for p in manager.list_posts("draft")} == {first.id, second.id}
+
+    def test_post_has_no_instance_dict(self, manager):
+        post = manager.create_post_draft(PostType.TUTORIAL)
+        with pytest.raises(AttributeError):
+            post.extra = "x"
+
+    def test_draft_without_markdown(self, manager):
+        post = manager.create_post_draft(PostType.TUTORIAL, write_markdown=False)
+
+        assert not (manager.drafts_dir / f"{post.id}.md").exists()
+        assert manager.get_post(post.id)["id"] == post.id
+
+    def test_identical_markdown_not_rewritten(self, manager, monkeypatch):
+        post = manager.create_post_draft(PostType.TUTORIAL)
+        writes = []
+        monkeypatch.setattr(
+            "scripts.linkedin.linkedin_manager._write_chunks",
+            lambda path, _chunks: writes.append(path),
+        )
+
+        manager._save_post(post, manager.drafts_dir)
+        assert writes == []
+
+        post.title = "Retitled"
+        manager._save_post(post, manager.drafts_dir)
+        assert writes == [manager.drafts_dir / f"{post.id}.md"]
+
+    def test_schedule_updates_store_and_calendar(self, manager):
+        post = manager.create_post_draft(PostType.TECHNICAL_INSIGHT)
+        when = datetime(2026, 3, 2, 9, 0)
+
+        manager.schedule_post(post.id, when)
+
+        assert not (manager.drafts_dir / f"{post.id}.md").exists()
+        scheduled = manager.get_post(post.id)
+        assert scheduled["status"] == "scheduled"
+        assert scheduled["scheduled_date"] == when.isoformat()
+        assert manager.list_posts("draft") == []
+        assert [p["id"] for p in manager.list_posts("scheduled")] == [post.id]
+
+        calendar = json.loads(manager.calendar_path.read_text())
+        assert calendar["posts"][-1] == {
+            "id": post.id,
+            "date": when.isoformat(),
+            "status": "scheduled",
+        }
+
+    def test_schedule_twice_raises(self, manager):
+        post = manager.create_post_draft(PostType.TECHNICAL_INSIGHT)
+        manager.schedule_post(post.id, datetime(2026, 3, 2))
+        with pytest.raises(FileNotFoundError):
+            manager.schedule_post(post.id, datetime(2026, 3, 3))
+
+    def test_legacy_json_posts_imported(self, tmp_path):
+        drafts = tmp_path / "linkedin" / "posts" / "drafts"
+        drafts.mkdir(parents=True)
+        legacy = {
+            "id": "tutorial_20250101_000000",
+            "type": "tutorial",
+            "title": "Old",
+            "content": "Body",
+            "hashtags": ["#AI"],
+            "scheduled_date": None,
+            "status": "draft",
+            "engagement": None,
+            "created_at": "2025-01-01T00:00:00",
+        }
+        (drafts / "tutorial_20250101_000000.json").write_text(json.dumps(legacy))
+
+        manager = LinkedInContentManager(project_root=str(tmp_path))
+
+        assert manager.get_post("tutorial_20250101_000000") == legacy
+        assert not (drafts / "tutorial_20250101_000000.json").exists()
+        assert (drafts / "tutorial_20250101_000000.json.imported").exists()
+
+    def test_non_post_json_skipped(self, tmp_path):
+        drafts = tmp_path / "linkedin" / "posts" / "drafts"
+        drafts.mkdir(parents=True)
+        (drafts / "notes.json").write_text(json.dumps({"todo": "write more"}))
+        (drafts / "broken.json").write_text("{")
+        post = {"id": "tutorial_1", "type": "tutorial", "status": "draft", "title": "T"}
+        (drafts / "tutorial_1.json").write_text(json.dumps(post))
+
+        with pytest.warns(UserWarning) as record:
+            manager = LinkedInContentManager(project_root=str(tmp_path))
+
+        messages = [str(w.message) for w in record]
+        assert len(messages) == 2
+        assert any(m.startswith("Skipping unreadable legacy post") for m in messages)
+        assert any(m.endswith("notes.json: not a post record") for m in messages)
+
+        assert manager.get_post("tutorial_1") == post
+        assert (drafts / "notes.json").exists()
+        assert (drafts / "broken.json").exists()
+        assert not (drafts / "tutorial_1.json").exists()
+
+    def test_partial_kwargs_fill_template(self, manager):
+        post = manager.create_post_draft(
+            PostType.INDUSTRY_COMMENTARY, hot_take="Agents need protocols."
+        )
+        assert post.content.startswith("Agents need protocols.")
+        # Unfilled fields stay as placeholders for manual editing
+        assert "{reasoning_paragraph}" in post.content
+        assert post.content.endswith(" ".join(post.hashtags))
+
+    def test_bare_draft_matches_full_render(self, manager):
+        post = manager.create_post_draft(PostType.TECHNICAL_INSIGHT)
+
+        tags = " ".join(post.hashtags)
+        expected = manager.POST_TEMPLATES[PostType.TECHNICAL_INSIGHT].strip()
+        assert post.content == expected.replace("{hashtags}", tags)
+
+    def test_type_without_template_is_empty(self, manager):
+        assert manager.create_post_draft(PostType.CASE_STUDY).content == ""
+
+    def test_hashtags_keep_primary_and_dedupe(self, manager):
+        hashtags = manager._select_hashtags(PostType.BUILD_IN_PUBLIC, count=10)
+        assert hashtags[:3] == ["#AI", "#MachineLearning", "#LLM"]
+        assert len(hashtags) == len(set(hashtags))
+
+    def test_profile_content_overrides_defaults(self, tmp_path):
+        config = tmp_path / "config"
+        config.mkdir()
+        (config / "master_profile.yaml").write_text(
+            yaml.safe_dump(
+                {
+                    "linkedin_content": {
+                        "hooks": {"multi_agent": ["Only hook"]},
+                        "topic_suggestions": {"tutorial": ["Only topic"]},
+                    }
+                }
+            )
+        )
+        manager = LinkedInContentManager(project_root=str(tmp_path))
+
+        assert manager.get_hook() == "Only hook"
+        assert manager._topic_suggestions(PostType.TUTORIAL) == ("Only topic",)
+        # Types the profile doesn't override keep the defaults
+        assert manager._topic_suggestions(PostType.BUILD_IN_PUBLIC)[0] == "Project weekly update"
+
+    def test_partial_hashtag_sets_fall_back_to_defaults(self, tmp_path):
+        config = tmp_path / "config"
+        config.mkdir()
+        (config / "master_profile.yaml").write_text(
+            yaml.safe_dump({"linkedin_content": {"hashtags": {"primary": ["#Mine"]}}})
+        )
+        manager = LinkedInContentManager(project_root=str(tmp_path))
+
+        assert manager.HASHTAG_SETS["primary"] == ("#Mine",)
+        assert manager.HASHTAG_SETS["niche"] == manager._DEFAULT_HASHTAG_SETS["niche"]
+        post = manager.create_post_draft(PostType.TUTORIAL)
+        assert post.hashtags[0] == "#Mine"
+
+    def test_profile_parsed_once_until_edited(self, tmp_path):
+        profile_path = tmp_path / "config" / "master_profile.yaml"
+        profile_path.parent.mkdir()
+        profile_path.write_text(yaml.safe_dump({"linkedin_content": {}}))
+
+        first = LinkedInContentManager(project_root=str(tmp_path))
+        second = LinkedInContentManager(project_root=str(tmp_path))
+        assert second.profile is first.profile
+
+        profile_path.write_text(yaml.safe_dump({"linkedin_content": {"hooks": {"x": ["y"]}}}))
+        os.utime(profile_path, ns=(0, profile_path.stat().st_mtime_ns + 1))
+        third = LinkedInContentManager(project_root=str(tmp_path))
+        assert third.HOOKS == {"x": ("y",)}
+
+    def test_random_seed_makes_output_reproducible(self, tmp_path):
+        profile_path = tmp_path / "config" / "master_profile.yaml"
+        profile_path.parent.mkdir()
+        profile_path.write_text(yaml.safe_dump({"linkedin_content": {"random_seed": 3}}))
+
+        runs = []
+        for _ in range(2):
+            manager = LinkedInContentManager(project_root=str(tmp_path))
+            runs.append(
+                (
+                    manager._select_hashtags(PostType.TECHNICAL_INSIGHT),
+                    manager.get_hook("llmops"),
+                    manager._get_topic_suggestion(PostType.TUTORIAL),
+                    manager.generate_content_calendar(weeks=4),
+                )
+            )
+        assert runs[0] == runs[1]
+
+    def test_post_ideas_merge_profile_and_defaults(self, tmp_path):
+        profile_path = tmp_path / "config" / "master_profile.yaml"
+        profile_path.parent.mkdir()
+        profile_path.write_text(
+            yaml.safe_dump({"linkedin_content": {"post_ideas": {"build_in_public": ["Mine"]}}})
+        )
+        manager = LinkedInContentManager(project_root=str(tmp_path))
+
+        assert manager.get_post_ideas(PostType.BUILD_IN_PUBLIC) == ["Mine"]
+        assert manager.get_post_ideas(PostType.TUTORIAL) == []
+        all_ideas = manager.get_post_ideas()
+        assert "Mine" in all_ideas
+        assert len(all_ideas) == 11
+        # Callers get their own list
+        all_ideas.clear()
+        assert len(manager.get_post_ideas()) == 11
+
+    def test_schedule_missing_draft_raises(self, manager):
+        with pytest.raises(FileNotFoundError):
+            manager.schedule_post("missing", datetime(2026, 3, 2))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Calendar and analytics
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestCalendar:
+    def test_calendar_rows_match_saved_entries(self, manager):
+        output = manager.generate_content_calendar(weeks=3)
+
+        saved = json.loads(manager.calendar_path.read_text())["posts"]
+        rows = [line for line in output.splitlines() if line.startswith("| 2")]
+        assert len(rows) == len(saved)
+        assert 6 <= len(saved) <= 9
+        for row, entry in zip(rows, saved):
+            assert row.startswith(f"| {entry['date']} | {entry['day']} | {entry['type']} |")
+            assert entry["day"] in ("Mon", "Wed", "Fri")
+
+    def test_seeded_generator_is_reproducible(self, manager):
+        manager._np_rng = np.random.default_rng(7)
+        first = manager.generate_content_calendar(weeks=6)
+        manager._np_rng = np.random.default_rng(7)
+        assert manager.generate_content_calendar(weeks=6) == first
+
+    def test_topics_drawn_from_matching_pool(self, manager):
+        manager.generate_content_calendar(weeks=8)
+
+        saved = json.loads(manager.calendar_path.read_text())["posts"]
+        for entry in saved:
+            pool = manager._topic_suggestions(PostType(entry["type"]))
+            assert entry["topic_suggestion"] in pool
+
+
+class TestEngagement:
+    def test_no_data(self, manager):
+        assert "No engagement data" in manager.analyze_engagement()
+
+    def test_totals(self, manager):
+        manager.analytics_path.parent.mkdir(parents=True)
+        manager.analytics_path.write_text(
+            json.dumps({"posts": [{"likes": 10, "comments": 2}, {"likes": 5}]})
+        )
+        report = manager.analyze_engagement()
+        assert "**Total Posts**: 2" in report
+        assert "**Total Likes**: 15" in report
+        assert "**Total Comments**: 2" in report
+        assert "**Avg Likes/Post**: 7.5" in report
+
+
+class TestHeadline:
+    def test_research_outranks_other_keywords(self, manager):
+        result = manager.suggest_headline_update("Startup platform team doing PhD-level work")
+        assert result["suggested"] == manager._DEFAULT_HEADLINE_TEMPLATES["research"]
+
+    def test_founding_keyword(self, manager):
+        result = manager.suggest_headline_update("Own our 0-to-1 infrastructure")
+        assert result["suggested"] == manager._DEFAULT_HEADLINE_TEMPLATES["founding"]
+
+    def test_no_keywords_uses_default(self, manager):
+        result = manager.suggest_headline_update("Backend engineer")
+        assert result["suggested"] == manager._DEFAULT_HEADLINE_TEMPLATES["default"]
+        assert result["reason"] == "Switching to job hunting headline for visibility"
@@ -7,6 +7,7 @@ import pytest
 from scripts.discovery.job_searcher import (
     _merge_locale,
     apply_targets_filter,
+    load_compiled_targets,
     load_targets,
 )
 
@@ -223,6 +224,14 @@ class TestLoadTargetsWithLocale:
         with pytest.raises(ValueError, match="Unknown locale"):
             load_targets(locale="narnia")
 
+    def test_compiled_targets_cached(self):
+        """Compiled targets are built once and reused until targets.yaml changes."""
+        targets, lookup = load_compiled_targets(locale="israel")
+        again, lookup_again = load_compiled_targets(locale="israel")
+        assert again is targets
+        assert lookup_again is lookup
+        assert lookup.company_tiers["monday.com"]["tier"] == "tier1"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Integration: locale config flows through apply_targets_filter
@@ -1,5 +1,8 @@
 """Tests for the Platform Sync Manager."""
 
+import json
+import os
+import subprocess
 import textwrap
 from pathlib import Path
 from unittest.mock import patch
@@ -7,7 +10,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from scripts.sync.sync_manager import PlatformSyncManager
+from scripts.sync.sync_manager import Platform, PlatformSyncManager, _load_profile_cached
 
 
 @pytest.fixture()
@@ -155,6 +158,55 @@ def manager(tmp_path: Path, minimal_profile: dict) -> PlatformSyncManager:  # no
     return PlatformSyncManager(project_root=str(tmp_path))
 
 
+class TestLoadProfile:
+    def test_parsed_once_until_edited(self, tmp_path: Path, minimal_profile: dict) -> None:
+        first = PlatformSyncManager(project_root=str(tmp_path))
+        second = PlatformSyncManager(project_root=str(tmp_path))
+        assert second.profile is first.profile
+
+        profile_path = tmp_path / "config" / "master_profile.yaml"
+        profile_path.write_text(yaml.dump({**minimal_profile, "projects": []}))
+        os.utime(profile_path, ns=(0, profile_path.stat().st_mtime_ns + 1))
+        first.reload_profile()
+        assert first.profile["projects"] == []
+
+    def test_json_sidecar_reused_by_next_process(
+        self, tmp_path: Path, minimal_profile: dict
+    ) -> None:
+        PlatformSyncManager(project_root=str(tmp_path))
+        sidecar = tmp_path / "config" / "master_profile.yaml.json"
+        assert json.loads(sidecar.read_text())["data"] == minimal_profile
+
+        # A fresh process has an empty in-memory cache; the YAML is not parsed
+        _load_profile_cached.cache_clear()
+        with patch("scripts.sync.sync_manager.yaml.load") as load:
+            manager = PlatformSyncManager(project_root=str(tmp_path))
+        load.assert_not_called()
+        assert manager.profile == minimal_profile
+
+    def test_stale_sidecar_ignored(self, tmp_path: Path, minimal_profile: dict) -> None:
+        PlatformSyncManager(project_root=str(tmp_path))
+        profile_path = tmp_path / "config" / "master_profile.yaml"
+        profile_path.write_text(yaml.dump({**minimal_profile, "projects": []}))
+        os.utime(profile_path, ns=(0, profile_path.stat().st_mtime_ns + 1))
+
+        _load_profile_cached.cache_clear()
+        assert PlatformSyncManager(project_root=str(tmp_path)).profile["projects"] == []
+
+    def test_no_sidecar_for_non_json_values(self, tmp_path: Path) -> None:
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "master_profile.yaml").write_text("updated: 2026-01-15\n")
+
+        manager = PlatformSyncManager(project_root=str(tmp_path))
+        assert not (config_dir / "master_profile.yaml.json").exists()
+        assert str(manager.profile["updated"]) == "2026-01-15"
+
+    def test_missing_profile_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            PlatformSyncManager(project_root=str(tmp_path))
+
+
 class TestSyncProjectsSection:
     def test_replaces_projects_section(self, manager: PlatformSyncManager) -> None:
         """Projects section should be replaced between markers."""
@@ -201,6 +253,15 @@ class TestSyncProjectsSection:
         assert r"R\&D Project" in result
         assert r"100\% coverage" in result
 
+    def test_all_special_characters_escaped(self, manager: PlatformSyncManager) -> None:
+        manager.profile["projects"] = [
+            {"name": "C# $tack", "technologies": ["scikit_learn"], "highlights": ["#1 & 50%"]},
+        ]
+        content = "%-----------PROJECTS-----------\nOLD\n%-----------EDUCATION-----------\n"
+        result = manager._sync_projects_section(content)
+        assert r"\textbf{C\# \$tack} $|$ \emph{scikit\_learn}" in result
+        assert r"\resumeItem{\#1 \& 50\%}" in result
+
 
 class TestSyncExperienceSection:
     def test_replaces_experience_section(self, manager: PlatformSyncManager) -> None:
@@ -238,6 +299,61 @@ class TestSyncExperienceSection:
         assert mgr._sync_experience_section(content) == content
 
 
+class TestSyncSections:
+    def test_matches_section_by_section_sync(self, manager: PlatformSyncManager) -> None:
+        content = textwrap.dedent("""\
+            \\begin{document}
+            %-----------EXPERIENCE-----------
+            OLD EXPERIENCE
+            %-----------PROJECTS-----------
+            OLD PROJECTS
+            %-----------EDUCATION-----------
+            \\section{Education}
+        """)
+        expected = manager._sync_experience_section(manager._sync_projects_section(content))
+        result = manager._sync_sections(content)
+        assert result == expected
+        assert result.startswith("\\begin{document}\n%-----------EXPERIENCE-----------\n")
+        assert result.endswith("%-----------EDUCATION-----------\n\\section{Education}\n")
+        assert "OLD" not in result
+
+    def test_missing_end_marker_leaves_section(self, manager: PlatformSyncManager) -> None:
+        content = "%-----------EXPERIENCE-----------\nOLD\n"
+        assert manager._sync_sections(content) == content
+
+
+class TestSyncResume:
+    @pytest.fixture()
+    def resume_path(self, manager: PlatformSyncManager) -> Path:
+        path = Path(manager.root) / "resume" / "base" / "master.tex"
+        path.parent.mkdir(parents=True)
+        path.write_text("\\def\\name{Old Name}\n")
+        return path
+
+    def test_backup_keeps_previous_contents(
+        self, manager: PlatformSyncManager, resume_path: Path
+    ) -> None:
+        with patch.object(manager, "_compile_resume_pdf", return_value=None):
+            result = manager.sync_resume()
+
+        assert result.success, result.errors
+        assert result.files_updated == [str(resume_path)]
+        assert "Old Name" not in resume_path.read_text()
+        assert resume_path.with_suffix(".tex.bak").read_text() == "\\def\\name{Old Name}\n"
+        assert not resume_path.with_suffix(".tex.tmp").exists()
+
+    def test_backup_copied_without_hardlinks(
+        self, manager: PlatformSyncManager, resume_path: Path
+    ) -> None:
+        with (
+            patch.object(manager, "_compile_resume_pdf", return_value=None),
+            patch("os.link", side_effect=OSError("not supported")),
+        ):
+            assert manager.sync_resume().success
+
+        assert resume_path.with_suffix(".tex.bak").read_text() == "\\def\\name{Old Name}\n"
+
+
 class TestCompileResumePdf:
     def test_graceful_when_pdflatex_missing(self, manager: PlatformSyncManager) -> None:
         """Should return None when pdflatex is not available."""
@@ -257,6 +373,102 @@ class TestCompileResumePdf:
         result = manager._compile_resume_pdf()
         assert result is None
 
+    def test_unchanged_source_skips_pdflatex(self, manager: PlatformSyncManager) -> None:
+        resume_dir = Path(manager.root) / "resume" / "base"
+        resume_dir.mkdir(parents=True, exist_ok=True)
+        (resume_dir / "master.tex").write_text("\\documentclass{article}")
+        calls = []
+
+        def fake_pdflatex(args, cwd, **_kwargs):
+            calls.append(args)
+            (Path(cwd) / "master.pdf").write_bytes(b"%PDF")
+            return subprocess.CompletedProcess(args, 0)
+
+        with patch("subprocess.run", side_effect=fake_pdflatex):
+            first = manager._compile_resume_pdf()
+            second = manager._compile_resume_pdf()
+        assert first == second
+        assert Path(first).read_bytes() == b"%PDF"
+        assert calls == [
+            ["pdflatex", "-interaction=nonstopmode", "-draftmode", "master.tex"],
+            ["pdflatex", "-interaction=nonstopmode", "master.tex"],
+        ]
+
+        (resume_dir / "master.tex").write_text("\\documentclass{report}")
+        with patch("subprocess.run", side_effect=fake_pdflatex):
+            manager._compile_resume_pdf()
+        assert len(calls) == 4
+
+    def test_failed_compile_not_cached(self, manager: PlatformSyncManager) -> None:
+        resume_dir = Path(manager.root) / "resume" / "base"
+        resume_dir.mkdir(parents=True, exist_ok=True)
+        (resume_dir / "master.tex").write_text("\\documentclass{article}")
+        (resume_dir / "master.pdf").write_bytes(b"%PDF")
+
+        failed = subprocess.CompletedProcess([], 1)
+        with patch("subprocess.run", return_value=failed) as run:
+            manager._compile_resume_pdf()
+            manager._compile_resume_pdf()
+        assert run.call_count == 4
+        assert not (Path(manager.root) / "resume" / "exports" / "resume.pdf.sha").exists()
+
+
+class TestSync:
+    def test_all_platforms_in_order(self, manager: PlatformSyncManager) -> None:
+        results = manager.sync(Platform.ALL)
+
+        assert [r.platform for r in results] == [
+            Platform.RESUME,
+            Platform.LINKEDIN,
+            Platform.GITHUB,
+            Platform.WEBSITE,
+        ]
+        assert results[0].errors == ["master.tex not found"]
+        assert results[1].success
+        assert (Path(manager.root) / "github" / "profile" / "README.md").exists()
+        assert manager.sync_log == results
+
+    def test_single_platform(self, manager: PlatformSyncManager) -> None:
+        results = manager.sync(Platform.LINKEDIN)
+        assert [r.platform for r in results] == [Platform.LINKEDIN]
+
+    def test_linkedin_files_written(self, manager: PlatformSyncManager) -> None:
+        result = manager.sync_linkedin()
+
+        assert result.files_updated == [
+            "linkedin/profile/headlines.md",
+            "linkedin/profile/about.md",
+            "linkedin/profile/experience.md",
+            "linkedin/profile/skills.md",
+            "linkedin/profile/SYNC_INSTRUCTIONS.md",
+        ]
+        skills = Path(manager.root, result.files_updated[3]).read_text(encoding="utf-8")
+        assert skills.startswith("# LinkedIn Skills\n")
+
+    def test_failed_write_reported(self, manager: PlatformSyncManager) -> None:
+        with patch("pathlib.Path.write_bytes", side_effect=OSError("disk full")):
+            result = manager.sync_github()
+
+        assert not result.success
+        assert result.files_updated == []
+        assert result.errors == ["GitHub sync failed: disk full"]
+
+
+class TestUpdateLatexField:
+    def test_replaces_def_macro(self, manager: PlatformSyncManager) -> None:
+        content = "\\def\\email{old@example.com}\n\\def\\emailx{keep}\n"
+        result = manager._update_latex_field(content, "email", "new@example.com")
+        assert result == "\\def\\email{new@example.com}\n\\def\\emailx{keep}\n"
+
+    def test_no_macro_leaves_content(self, manager: PlatformSyncManager) -> None:
+        content = "\\name{Test User}"
+        assert manager._update_latex_field(content, "name", "Other") == content
+
+    def test_fields_updated_in_one_pass(self, manager: PlatformSyncManager) -> None:
+        content = "\\def\\name{Old}\n\\def\\phone{0}\n\\def\\title{keep}\n"
+        result = manager._update_latex_fields(content, {"name": "New \\& Co", "phone": "1"})
+        assert result == "\\def\\name{New \\& Co}\n\\def\\phone{1}\n\\def\\title{keep}\n"
+
 
 class TestUpdateLatexHeadline:
     def test_headline_replacement(self, manager: PlatformSyncManager) -> None: